@@ -3,12 +3,17 @@ ABOUTME: Provides pattern loading/saving and audio event queueing without blocki
 
 import queue
 import concurrent.futures
+from collections import deque
 from typing import Dict, List, Any, Callable, Optional
 from .pattern_manager import PatternManager
 
 
 class AudioQueue:
-    """Thread-safe queue for audio parameter changes and events."""
+    """Lock-free queue for audio parameter changes and events.
+
+    Backed by a deque: producers only append and the audio thread only pops
+    from the left, both atomic in CPython, so neither side takes a lock.
+    """
 
     def __init__(self, maxsize: int = 100):
         """Initialize audio event queue.
@@ -16,7 +21,8 @@ class AudioQueue:
         Args:
             maxsize: Maximum queue size before dropping events
         """
-        self._queue: queue.Queue = queue.Queue(maxsize=maxsize)
+        self._maxsize = maxsize
+        self._items: deque = deque()
 
     def put(self, event: Dict[str, Any]) -> bool:
         """Send event to audio thread (non-blocking).
@@ -27,12 +33,11 @@ class AudioQueue:
         Returns:
             True if event was queued, False if queue was full (event dropped)
         """
-        try:
-            self._queue.put_nowait(event)
-            return True
-        except queue.Full:
+        if len(self._items) >= self._maxsize:
             # Queue is full - drop event to prevent blocking
             return False
+        self._items.append(event)
+        return True
 
     def get_all(self) -> List[Dict[str, Any]]:
         """Get all pending events (audio thread only).
@@ -40,21 +45,16 @@ class AudioQueue:
         Returns:
             List of all queued events, empty list if queue is empty
         """
-        events = []
-        while True:
-            try:
-                events.append(self._queue.get_nowait())
-            except queue.Empty:
-                break
-        return events
+        # Pop exactly the events present on entry; ones put meanwhile stay queued.
+        items = self._items
+        pop = items.popleft
+        return [pop() for _ in range(len(items))]
 
     def clear(self) -> None:
         """Clear all pending events."""
-        while True:
-            try:
-                self._queue.get_nowait()
-            except queue.Empty:
-                break
+        items = self._items
+        for _ in range(len(items)):
+            items.popleft()
 
 
 class PatternLoader:
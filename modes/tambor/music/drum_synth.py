@@ -183,10 +183,13 @@ class DrumSynth:
         duration = min(duration, 1.5)  # Cap at 1.5 seconds
 
         samples = _synthesize_drum(synth_params, duration)
-        pcm_mono = (samples * 32767).astype(np.int16)
-
-        # pygame mixer uses stereo — duplicate mono channel
-        pcm_stereo = np.column_stack((pcm_mono, pcm_mono))
+        # pygame mixer uses stereo, so duplicate the mono channel.  The mixer
+        # was opened as 16-bit, so int16 is required here; scale, cast and
+        # duplicate in one ufunc pass straight into the stereo buffer instead
+        # of building a float temp, an int16 mono copy and a stacked copy.
+        # _soft_clip keeps samples inside [-1, 1] so the cast cannot wrap.
+        pcm_stereo = np.empty((samples.shape[0], 2), dtype=np.int16)
+        np.multiply(samples[:, None], 32767, out=pcm_stereo, casting="unsafe")
 
         sound = self._pygame.sndarray.make_sound(pcm_stereo)
         with self._lock:
@@ -0,0 +1,220 @@
+# ABOUTME: Per-sample DSP recurrences used by SynthEngine's voice chain (filters, DC blocker, waveshaper, mix bus).
+# ABOUTME: JIT-compiled with numba when installed; otherwise run as plain Python loops.
+
+import math
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit when numba is not installed: returns the
+        function unchanged, so every kernel still runs as an ordinary loop."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda fn: fn
+
+
+# numba rather than a Cython/C extension: the app ships as plain Python on
+# desktop and Raspberry Pi, and a compiled module would need a build step and
+# per-platform wheels.  Only the true per-sample recurrences live here; the
+# oscillators and envelopes are already block-vectorized NumPy, so compiling
+# them would gain little.
+#
+# Kernels are deliberately serial: no parallel=True / prange.  A buffer of
+# voice work is only a few microseconds, less than the cost of waking numba's
+# worker pool (an 8-voice x 480-sample one-pole ran 14 us under prange versus
+# 12 us serially), and the workers are not realtime-priority threads, so a
+# parallel voice loop adds callback jitter rather than removing it.
+
+# SVF routing codes for svf_hp_kernel.  Resolved from the routing string once
+# per call in SynthEngine so the kernel loop never compares strings.
+SVF_OUT_HP    = 0   # "lp_hp"    → HP output (MS-20 default)
+SVF_OUT_BP    = 1   # "bp_lp"    → BP output
+SVF_OUT_NOTCH = 2   # "notch_lp" → input - lp
+SVF_OUT_LP    = 3   # "lp_lp"    → LP output
+
+SVF_ROUTING_CODES = {
+    "lp_hp":    SVF_OUT_HP,
+    "bp_lp":    SVF_OUT_BP,
+    "notch_lp": SVF_OUT_NOTCH,
+    "lp_lp":    SVF_OUT_LP,
+}
+
+
+@njit(cache=True)
+def svf_hp_kernel(samples, out, f, q, lp, bp, mode):
+    """Chamberlin SVF over one buffer; writes the selected output into out.
+
+    Same update order and ±4.0 integrator clamp as the original Python loop.
+    Returns the final (lp, bp) integrator states.
+    """
+    for i in range(samples.shape[0]):
+        x = float(samples[i])
+        lp = lp + f * bp
+        hp = x - lp - q * bp
+        bp = bp + f * hp
+        # Hard clamp prevents integrator blow-up at extreme q values.
+        if lp > 4.0:
+            lp = 4.0
+        elif lp < -4.0:
+            lp = -4.0
+        if bp > 4.0:
+            bp = 4.0
+        elif bp < -4.0:
+            bp = -4.0
+        if mode == SVF_OUT_HP:
+            out[i] = hp
+        elif mode == SVF_OUT_BP:
+            out[i] = bp
+        elif mode == SVF_OUT_NOTCH:
+            out[i] = x - lp
+        else:
+            out[i] = lp
+    return lp, bp
+
+
+@njit(cache=True)
+def ladder_kernel(samples, out, alpha, k, s0, s1, s2, s3):
+    """4-pole Moog ladder with tanh input and stage-3 saturation.
+
+    One-sample-delayed global feedback, identical to the Python reference.
+    Writes the (unscaled) stage-3 output into out and returns the final states.
+    """
+    a1 = 1.0 - alpha
+    fb = 4.0 * k
+    for i in range(samples.shape[0]):
+        x0 = math.tanh(float(samples[i]) - fb * s3)
+        s0 = a1 * s0 + alpha * x0
+        s1 = a1 * s1 + alpha * s0
+        s2 = a1 * s2 + alpha * s1
+        s3 = math.tanh(a1 * s3 + alpha * s2)
+        out[i] = s3
+    return s0, s1, s2, s3
+
+
+@njit(cache=True)
+def leaky_integrator_kernel(samples, out, alpha, state):
+    """One-pole leaky integrator (capacitor waveshaper) over one buffer.
+
+    state += alpha * (x - state) per sample; writes each state into out and
+    returns the final state.
+    """
+    for i in range(samples.shape[0]):
+        state += alpha * (float(samples[i]) - state)
+        out[i] = state
+    return state
+
+
+@njit(cache=True)
+def stereo_highpass_clip_kernel(left, right, c, xl, yl, xr, yr):
+    """One-pole high-pass y = x - x[n-1] + c*y[n-1] on both channels, in place.
+
+    Each output is clamped to ±1 as it is stored; the returned filter states
+    (xl, yl, xr, yr) are the unclamped values, as in the Python loop.
+    """
+    for i in range(left.shape[0]):
+        x = float(left[i])
+        yl = x - xl + c * yl
+        xl = x
+        left[i] = min(1.0, max(-1.0, yl))
+        x = float(right[i])
+        yr = x - xr + c * yr
+        xr = x
+        right[i] = min(1.0, max(-1.0, yr))
+    return xl, yl, xr, yr
+
+
+@njit(cache=True)
+def dc_blocker_kernel(samples, out, c, z):
+    """DC blocker H(z) = (1 - z^-1)/(1 - c*z^-1) over one buffer.
+
+    Runs the same transposed direct-form II update as scipy's lfilter, in
+    float64, so z is interchangeable with lfilter's zi[0].  samples may alias
+    out.  Returns the final z and the last input and output samples.
+    """
+    x = 0.0
+    y = 0.0
+    for i in range(samples.shape[0]):
+        x = float(samples[i])
+        y = x + z
+        z = c * y - x
+        out[i] = y
+    return z, x, y
+
+
+@njit(cache=True)
+def dc_blocker_rows_kernel(mat, rows, coeffs, state, n):
+    """dc_blocker_kernel in place on mat[rows[k], :n] for every k.
+
+    state[k] holds (z, last x, last y) for row k: z is read on entry and all
+    three are written back, so one call filters every voice's output row.
+    """
+    for k in range(rows.shape[0]):
+        row = mat[rows[k], :n]
+        z, x, y = dc_blocker_kernel(row, row, coeffs[k], state[k, 0])
+        state[k, 0] = z
+        state[k, 1] = x
+        state[k, 2] = y
+
+
+@njit(cache=True)
+def one_pole_lowpass_kernel(samples, out, b, c, z):
+    """One-pole low-pass y = b*x + c*y[n-1] over one buffer.
+
+    The transposed direct-form II update lfilter([b], [1, -c]) runs, in
+    float64, so z is interchangeable with its zi[0].  samples may alias out.
+    Returns the final z.
+    """
+    for i in range(samples.shape[0]):
+        y = b * float(samples[i]) + z
+        z = c * y
+        out[i] = y
+    return z
+
+
+@njit(cache=True)
+def interleave_clip_kernel(src, out):
+    """Clamp a (2, n) channel-major block to ±1 into an interleaved (n, 2) buffer.
+
+    One pass over both channels, writing out front to back; the float32
+    counterpart of a fused clip-and-cast to the device sample format.
+    """
+    for i in range(out.shape[0]):
+        for ch in range(2):
+            v = src[ch, i]
+            if v > 1.0:
+                v = 1.0
+            elif v < -1.0:
+                v = -1.0
+            out[i, ch] = v
+
+
+def warm_up():
+    """Compile every kernel for the dtypes the engine passes in.
+
+    numba compiles lazily on first call; doing that inside the audio callback
+    would stall it for hundreds of milliseconds.  With cache=True this is a
+    fast disk load after the first run.  No-op without numba.
+    """
+    if not NUMBA_AVAILABLE:
+        return
+    for dt in (np.float32, np.float64):
+        x = np.zeros(4, dtype=dt)
+        out = np.zeros(4, dtype=np.float32)
+        svf_hp_kernel(x, out, 0.1, 1.0, 0.0, 0.0, SVF_OUT_HP)
+        ladder_kernel(x, out, 0.1, 0.5, 0.0, 0.0, 0.0, 0.0)
+        leaky_integrator_kernel(x, out, 0.1, 0.0)
+    y = np.zeros(4, dtype=np.float32)
+    stereo_highpass_clip_kernel(y, y.copy(), 0.99, 0.0, 0.0, 0.0, 0.0)
+    dc_blocker_kernel(y, y, 0.999, 0.0)
+    one_pole_lowpass_kernel(y, y, 0.1, 0.9, 0.0)
+    dc_blocker_rows_kernel(np.zeros((2, 4), dtype=np.float32),
+                           np.zeros(1, dtype=np.int64), np.zeros(1),
+                           np.zeros((1, 3)), 4)
+    lr = np.zeros((2, 8), dtype=np.float32)
+    interleave_clip_kernel(lr[:, :4], np.zeros((4, 2), dtype=np.float32))
@@ -75,7 +75,7 @@ def _audio_process_main(cmd_queue, ready_event, error_event, error_msg_arr, star
                 engine.modulation_change(msg['value'])
             else:
                 # param_update, soft_all_notes_off, mute_gate, drum_trigger
-                # go directly to the engine's internal threading.Queue for
+                # go directly to the engine's internal event queue for
                 # sample-accurate processing on the audio callback thread.
                 engine.midi_event_queue.put(msg)
 
@@ -0,0 +1,73 @@
+# ABOUTME: Lock-free FIFO carrying MIDI/control events from UI and MIDI threads to the audio callback.
+# ABOUTME: queue.Queue-compatible put side; the audio thread drains it in one batch per buffer.
+
+import queue
+from collections import deque
+
+
+class EventQueue:
+    """Unbounded event FIFO with no mutex on either side.
+
+    queue.Queue takes a threading.Lock and notifies a Condition on every put
+    and get, so a UI thread holding the lock can stall the audio callback.
+    Here producers only ever append and the single consumer (the audio
+    callback) only ever pops from the left.  Both are single atomic deque
+    operations in CPython, so no lock is needed and any number of producer
+    threads may call put() concurrently.
+
+    The put side mirrors queue.Queue (put / put_nowait) so existing callers
+    keep working unchanged.  There is no blocking get: the consumer is a
+    realtime callback and must never wait.
+    """
+
+    def __init__(self):
+        self._items: deque = deque()
+
+    def put(self, item, block: bool = True, timeout=None) -> None:
+        """Enqueue an event.  Never blocks: the queue is unbounded."""
+        self._items.append(item)
+
+    def put_nowait(self, item) -> None:
+        """Enqueue an event (alias of put, as with queue.Queue)."""
+        self._items.append(item)
+
+    def get_nowait(self):
+        """Pop the oldest event; raises queue.Empty when there is none."""
+        try:
+            return self._items.popleft()
+        except IndexError:
+            raise queue.Empty from None
+
+    def drain(self) -> list:
+        """Remove and return every event queued so far, oldest first.
+
+        Takes exactly the items present on entry: producers only append, so
+        those len() items are guaranteed to be there, and events put while
+        draining stay queued for the next call.  Consumer thread only.
+
+        The items are popped rather than taken by swapping in a fresh deque:
+        a producer may already have loaded the old deque to append to it, and
+        after a swap that event would land in a container nobody reads.
+        """
+        items = self._items
+        n = len(items)
+        if not n:
+            return []
+        pop = items.popleft
+        return [pop() for _ in range(n)]
+
+    def requeue(self, items) -> None:
+        """Put events back at the head, ahead of anything queued since.
+
+        For events the consumer drained but chose to defer: they keep their
+        original order and still come out before events put after the drain.
+        appendleft is as atomic as append, so producers need no lock here
+        either.  Consumer thread only.
+        """
+        self._items.extendleft(reversed(items))
+
+    def empty(self) -> bool:
+        return not self._items
+
+    def qsize(self) -> int:
+        return len(self._items)
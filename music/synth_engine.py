@@ -7,10 +7,12 @@ import ctypes
 import platform
 import numpy as np
 import threading
-import queue
 import random as _rnd
 from typing import Optional, List
 
+from music import _dsp_kernels
+from music.event_queue import EventQueue
+
 # Check for sounddevice availability
 try:
     import sounddevice as sd
@@ -19,11 +21,145 @@ except ImportError:
     AUDIO_AVAILABLE = False
     sd = None
 
+# scipy is optional: resolved once at import so neither engine construction nor
+# any DSP method performs an import.  SynthEngine picks what it uses in __init__.
+try:
+    from scipy.signal import sosfilt as _sosfilt, lfilter as _lfilter
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
+    _sosfilt = _lfilter = None
+
+# DC blocker numerator H(z) = (1 - z^-1)/(1 - coeff*z^-1).  Constant, so it is
+# shared by every voice instead of rebuilt on each lfilter call.
+_DC_B = np.array([1.0, -1.0])
+
+# Phase constants for the render path, so per-buffer phase math does not
+# rebuild 2π (and its reciprocal) from np.pi on every use.
+_TWO_PI = 2.0 * math.pi
+_INV_TWO_PI = 1.0 / _TWO_PI
+
+
+# Normalized MIDI velocity (0-127 -> 0.0-1.0). MIDI velocity is quantized to
+# 128 steps, so the division is done once here instead of on every note event.
+_VEL_LUT = tuple(v / 127.0 for v in range(128))
+
+
+# Equal-tempered frequency of every MIDI note (A4 = 69 = 440 Hz).
+_MIDI_FREQ = tuple(440.0 * (2.0 ** ((n - 69) / 12.0)) for n in range(128))
+
+
+# Envelope velocity curve: peak level = _VEL_FLOOR + (1 - _VEL_FLOOR) * v ** _VEL_CURVE.
+_VEL_CURVE, _VEL_FLOOR = 1.3, 0.15
+
+
+def _vel_norm(velocity) -> float:
+    """Map a MIDI velocity to 0.0-1.0 via _VEL_LUT, clamping out-of-range input."""
+    return _VEL_LUT[min(127, max(0, int(velocity)))]
+
+
+# ── Pitched waveform shapers ─────────────────────────────────────────────────
+# Each writes one waveform into samples from its phase arrays, in place.
+# Elementwise only, so the arrays may be 1-D (one voice) or 2-D (voices ×
+# samples).  Looked up once per buffer in _WAVE_SHAPERS, so no string
+# comparisons run on the render path.
+#
+# Shapes are computed directly rather than read from a wavetable: in NumPy an
+# interpolated 4096-entry table lookup takes seven passes (scale, floor, two
+# gathers, lerp) and measured ~4 ns/sample against ~1.1 ns for np.sin, while
+# saw/square/triangle are already one or two arithmetic passes.  A static
+# table would also bypass the PolyBLEP band-limiting applied per frequency.
+
+def _shape_pure_sine(phases: np.ndarray, t_norm: np.ndarray, samples: np.ndarray) -> None:
+    # Direct np.sin on float32 is SIMD and costs ~1.4 ns/sample; a
+    # two-term recurrence (s[n] = 2cos(w)s[n-1] - s[n-2]) is serially
+    # dependent and measured ~2.5x slower even compiled, and it drifts.
+    np.sin(phases, out=samples)
+
+
+def _shape_sine(phases: np.ndarray, t_norm: np.ndarray, samples: np.ndarray) -> None:
+    # 0.99·sin(φ) + 0.01·sin(2φ) folded via sin(2φ) = 2·sin(φ)·cos(φ)
+    # into sin(φ)·(0.99 + 0.02·cos(φ)): one fewer multiply pass and no
+    # temporary.  Clobbers t_norm, which is free scratch here (PolyBLEP
+    # skips sine).
+    np.sin(phases, out=samples)
+    np.cos(phases, out=t_norm)
+    t_norm *= np.float32(0.02)
+    t_norm += np.float32(0.99)
+    samples *= t_norm
+
+
+def _shape_triangle(phases: np.ndarray, t_norm: np.ndarray, samples: np.ndarray) -> None:
+    np.subtract(t_norm, np.float32(0.5), out=samples)
+    np.abs(samples, out=samples)
+    samples *= np.float32(4.0)
+    samples -= np.float32(1.0)
+
+
+def _shape_square(phases: np.ndarray, t_norm: np.ndarray, samples: np.ndarray) -> None:
+    # sin(φ) >= 0 exactly when t_norm < 0.5, so the sign of (0.5 - t_norm)
+    # gives the same ±1 wave without evaluating a transcendental.
+    np.subtract(np.float32(0.5), t_norm, out=samples)
+    np.sign(samples, out=samples)
+
+
+def _shape_sawtooth(phases: np.ndarray, t_norm: np.ndarray, samples: np.ndarray) -> None:
+    np.multiply(t_norm, np.float32(2.0), out=samples)
+    samples -= np.float32(1.0)
+
+
+# Unknown names fall back to sawtooth, as the old if/elif chain did.
+_WAVE_SHAPERS = {
+    "pure_sine": _shape_pure_sine,
+    "sine":      _shape_sine,
+    "triangle":  _shape_triangle,
+    "square":    _shape_square,
+    "sawtooth":  _shape_sawtooth,
+}
+
+# Waveforms with hard edges that get PolyBLEP correction.
+_POLYBLEP_WAVEFORMS = frozenset(("sawtooth", "square", "triangle"))
+
+# Shapes that read only the phase in radians.  Every other shape (and
+# PolyBLEP) reads the normalised phase t_norm, derived from the radian phase;
+# for these two that extra multiply and mod pass is skipped.
+_SINE_WAVEFORMS = frozenset(("pure_sine", "sine"))
+
 
 class Voice:
     """Individual synthesizer voice with its own oscillator and envelope."""
 
-    def __init__(self, sample_rate: int, voice_index: int = 0, buffer_size: int = 512):
+    # The callback reads dozens of these per voice per buffer; slots make each
+    # a fixed-offset load instead of an instance-dict lookup.  Every attribute
+    # set in __init__ must be listed here.
+    __slots__ = (
+        "sample_rate", "voice_index", "midi_note", "base_frequency", "frequency",
+        "phase", "phase2", "envelope_samples", "note_active", "is_releasing",
+        "release_start_level", "steal_start_level", "age",
+        "velocity", "velocity_current", "velocity_target", "release_velocity",
+        "_vel_curve_in", "_vel_curve",
+        "dc_blocker_x", "dc_blocker_y", "last_envelope_level", "onset_samples",
+        "phase_offset", "pan", "sine_phase",
+        "filter_state_ladder1", "filter_state_ladder2",
+        "filter_state_svf1_lp", "filter_state_svf1_bp",
+        "filter_state_svf2_lp", "filter_state_svf2_bp",
+        "onset_ms", "_oversample_history", "_oversample_history_r2",
+        "_oversample_history_sine", "last_output_sample", "crossfade_samples",
+        "feg_time", "feg_is_releasing", "feg_release_start", "feg_release_level",
+        "pre_gate_progress", "release_time_cap", "_glide_from_freq", "_glide_elapsed",
+        "is_ghost", "smooth_fl_lpf", "smooth_fl_hpf", "smooth_resonance",
+        "_ktrack_key", "_ktrack_mult",
+        "_arm_lpf_zi_r1", "_arm_lpf_zi_r2", "_arm_hpf_zi_r1", "_arm_hpf_zi_r2",
+        "_arm_dcblock_zi", "_dc_a",
+        "_v_osc_buf", "_v_osc_buf_r2", "_v_osc_buf_sin", "_v_phase_arr", "_v_tnorm_buf",
+        "_v_env_buf", "_v_times_buf", "_v_onset_ramp", "_v_rel_curve", "_v_rel_curve_tc",
+        "_v_flt_buf", "_v_flt_buf_r2", "_v_dc_buf", "_v_cap_ws_buf",
+        "cap_env", "sustain_cap", "cap_ws_state",
+        "osc_peak_pos", "osc_peak_neg", "out_peak",
+    )
+
+    def __init__(self, sample_rate: int, voice_index: int = 0, buffer_size: int = 512,
+                 out_buf: Optional[np.ndarray] = None):
         self.sample_rate = sample_rate
         self.voice_index = voice_index
         self.midi_note: Optional[int] = None
@@ -31,7 +167,10 @@ class Voice:
         self.frequency: Optional[float] = None
         self.phase = 0.0
         self.phase2 = 0.0
-        self.envelope_time = 0.0
+        # Envelope position as an integer sample count: exact over long
+        # releases and directly usable as a segment split point.  The seconds
+        # view is the envelope_time property below.
+        self.envelope_samples = 0
         self.note_active = False
         self.is_releasing = False
         self.release_start_level = 0.0
@@ -41,6 +180,10 @@ class Voice:
         self.velocity_current = 1.0
         self.velocity_target = 1.0
         self.release_velocity = 0.5
+        # velocity_curve() memo: the curve costs a pow, and velocity only moves
+        # while it is being smoothed toward a new note's target.
+        self._vel_curve_in = 1.0
+        self._vel_curve = 1.0
         self.dc_blocker_x = 0.0
         self.dc_blocker_y = 0.0
         self.last_envelope_level = 0.0
@@ -144,6 +287,10 @@ class Voice:
         self.smooth_fl_lpf: float = -1.0
         self.smooth_fl_hpf: float = -1.0
         self.smooth_resonance: float = -1.0  # per-voice resonance smoothing, -1.0 = uninitialised
+        # Key-tracking multiplier cache: only recomputed when the note, octave
+        # shift or key-tracking amount differs from the inputs stored in the key.
+        self._ktrack_key: tuple = ()
+        self._ktrack_mult: float = 1.0
 
         # ARM Lite fast filter: scipy sosfilt and lfilter state per voice per rank.
         # None = uninitialised (allocated on first use or after voice.reset()).
@@ -153,6 +300,8 @@ class Voice:
         self._arm_hpf_zi_r1: Optional[np.ndarray] = None
         self._arm_hpf_zi_r2: Optional[np.ndarray] = None
         self._arm_dcblock_zi: Optional[np.ndarray] = None
+        # DC blocker denominator [1, -coeff]; coeff is rewritten in place per buffer.
+        self._dc_a = np.array([1.0, -0.999])
 
         # ── Pre-allocated hot-path working buffers ────────────────────────────
         # Each voice carries its own set of reusable numpy arrays so the audio
@@ -171,10 +320,20 @@ class Voice:
         self._v_env_buf:     np.ndarray = np.zeros(buffer_size, dtype=np.float32)
         self._v_times_buf:   np.ndarray = np.zeros(buffer_size, dtype=np.float32)
         self._v_onset_ramp:  np.ndarray = np.ones(buffer_size,  dtype=np.float32)
+        # Release decay shape exp(-i·dt/time_const) for one buffer, rebuilt only
+        # when time_const changes (once per release in practice).
+        self._v_rel_curve:   np.ndarray = np.ones(buffer_size,  dtype=np.float32)
+        self._v_rel_curve_tc: float = 0.0
         # Filter output (shared across ladder and SVF — never used simultaneously).
+        # Rank 2 gets its own buffer: rank 1's filtered signal is still live
+        # when rank 2 is filtered, and both are mixed afterwards.
         self._v_flt_buf:     np.ndarray = np.zeros(buffer_size, dtype=np.float32)
-        # DC blocker output buffer (desktop non-scipy path).
-        self._v_dc_buf:      np.ndarray = np.zeros(buffer_size, dtype=np.float32)
+        self._v_flt_buf_r2:  np.ndarray = np.zeros(buffer_size, dtype=np.float32)
+        # DC blocker output buffer (filled by both the lfilter and loop paths).
+        # This is the voice's final output; the engine passes a row of its
+        # voice-major output matrix so all voices' outputs sit contiguously.
+        self._v_dc_buf:      np.ndarray = (out_buf if out_buf is not None
+                                           else np.zeros(buffer_size, dtype=np.float32))
         # ── Analog capacitor simulation state ───────────────────────────────────
         # cap_env: slow RMS follower for varicap filter darkening (Feature 1).
         self.cap_env: float = 0.0
@@ -208,7 +367,7 @@ class Voice:
         self.velocity_target = velocity
         self.note_active = True
         self.is_releasing = False
-        self.envelope_time = 0.0
+        self.envelope_samples = 0
         self.age = 0.0
         self.onset_samples = 0   # restart the per-voice fade-in ramp
         self.onset_ms = 3.0      # reset to default; _trigger_note sets the real value
@@ -244,16 +403,27 @@ class Voice:
                 self._oversample_history_r2[:] = 0.0
                 self._oversample_history_sine[:] = 0.0
 
+    @property
+    def envelope_time(self) -> float:
+        """Seconds since the current envelope stage began."""
+        return self.envelope_samples / self.sample_rate
+
+    def velocity_curve(self) -> float:
+        """Envelope peak level for the current smoothed velocity."""
+        vel = self.velocity
+        if vel != self._vel_curve_in:
+            self._vel_curve = _VEL_FLOOR + (1.0 - _VEL_FLOOR) * (vel ** _VEL_CURVE)
+            self._vel_curve_in = vel
+        return self._vel_curve
+
     def release(self, attack: float, decay: float, sustain: float, intensity: float, release_velocity: float = 0.5):
         if self.note_active:
             self.is_releasing = True
             self.note_active = False
             self.release_velocity = release_velocity
-            VEL_C, VEL_F = 1.3, 0.15
-            v_scaled = VEL_F + (1.0 - VEL_F) * (self.velocity ** VEL_C)
-            v_int = intensity * v_scaled
+            v_int = intensity * self.velocity_curve()
             self.release_start_level = self.last_envelope_level if self.last_envelope_level > 0.0001 else (v_int * sustain)
-            self.envelope_time = 0.0
+            self.envelope_samples = 0
 
     def reset(self):
         self.midi_note = None
@@ -261,7 +431,7 @@ class Voice:
         self.frequency = None
         self.note_active = False
         self.is_releasing = False
-        self.envelope_time = 0.0
+        self.envelope_samples = 0
         self.age = 0.0
         self.filter_state_ladder1 = [0.0, 0.0, 0.0, 0.0]
         self.filter_state_ladder2 = [0.0, 0.0, 0.0, 0.0]
@@ -441,6 +611,35 @@ class SynthEngine:
     # of a Raspberry Pi or similar single-board computer.
     _IS_ARM = platform.machine() in ("armv7l", "aarch64")
 
+    # Waveforms without phase state; generated per call, never batched.
+    _NOISE_WAVEFORMS = frozenset(("noise_white", "noise_pink"))
+    # Ghost release tails mix at 0.7x, centre-panned (constant-power π/4).
+    _GHOST_PAN_GAIN = 0.7 * math.cos(math.pi / 4.0)
+    # Master-stage constants: tanh saturation ceiling per waveform (others 1.0)
+    # and pre-tanh octave loudness boost.  Resolved into _wave_ceiling and
+    # _octave_comp by _refresh_master_consts whenever waveform or octave is set.
+    _WAVE_CEILING = {"sine": 0.95, "pure_sine": 0.95, "square": 0.75}
+    _OCTAVE_COMP = {-2: 1.25, -1: 1.12, 0: 1.0, 1: 1.0, 2: 1.0}
+    # param_update keys written to another attribute (smoothed params go to
+    # their *_target) or coerced, as (attribute, conversion or None).
+    _PARAM_REDIRECTS = {
+        "amp_level":      ("amp_level_target", None),
+        "master_volume":  ("master_volume_target", None),
+        "cutoff":         ("cutoff_target", None),
+        "hpf_cutoff":     ("hpf_cutoff_target", None),
+        "resonance":      ("resonance_target", None),
+        "hpf_resonance":  ("hpf_resonance_target", None),
+        "noise_level":    ("noise_level_target", None),
+        "key_tracking":   ("key_tracking_target", None),
+        "filter_drive":   ("filter_drive_target", float),
+        "filter_routing": ("filter_routing", None),
+        "feg_attack":     ("feg_attack", float),
+        "feg_decay":      ("feg_decay", float),
+        "feg_sustain":    ("feg_sustain", float),
+        "feg_release":    ("feg_release", float),
+        "feg_amount":     ("feg_amount", float),
+    }
+
     def __init__(self, output_device_index=None, buffer_size=480, audio_backend=None,
                  enable_oversampling=True, level_shm_name=None):
         # Sample rate default: 48000 Hz. Override with ACORDES_SAMPLE_RATE env var
@@ -450,6 +649,10 @@ class SynthEngine:
         _VALID_RATES = {44100, 48000, 88200, 96000}
         _env_rate = int(os.environ.get("ACORDES_SAMPLE_RATE", "0"))
         self.sample_rate = _env_rate if _env_rate in _VALID_RATES else 48000
+        # Rate-derived constants for the render path, so per-buffer phase and
+        # envelope math does not redo the division (the rate never changes).
+        self._two_pi_over_sr = _TWO_PI / self.sample_rate
+        self._env_dt = np.float32(1.0 / self.sample_rate)
         # ARM: floor at 2048 (~46ms at 44100Hz). The Pi 4's single usable Python
         # core (GIL) must handle both Textual UI and the audio callback. 1024
         # (~43ms) leaves too little headroom and causes periodic underruns that
@@ -472,8 +675,8 @@ class SynthEngine:
         # Startup diagnostic string populated after stream init (ARM only).
         # Read by engine_proxy._audio_process_main and forwarded to LoadingScreen.
         self._startup_info = ""
-        # Import scipy signal functions once at init time so the audio callback
-        # never pays the import cost. Falls back gracefully if scipy is not installed.
+        # scipy signal functions (imported once at module load, None when scipy
+        # is not installed) so the audio callback never pays the import cost.
         #
         # _scipy_sosfilt: ARM only. Replaces the 4-pole Moog ladder + SVF with a
         #   2nd-order biquad approximation. Necessary on ARM because the Python
@@ -483,15 +686,8 @@ class SynthEngine:
         # _scipy_lfilter: All platforms. Used only for the DC blocker — an exact
         #   implementation (not an approximation), gives ~100x speedup with zero
         #   quality trade-off. Especially valuable when oversampling is enabled.
-        self._scipy_sosfilt = None
-        self._scipy_lfilter = None
-        try:
-            from scipy.signal import sosfilt as _sosfilt, lfilter as _lfilter
-            if self._IS_ARM:
-                self._scipy_sosfilt = _sosfilt
-            self._scipy_lfilter = _lfilter
-        except ImportError:
-            pass
+        self._scipy_sosfilt = _sosfilt if self._IS_ARM else None
+        self._scipy_lfilter = _lfilter
         self.stream = None
         # -1 = No Audio mode (engine runs silently, no audio stream opened)
         # -2 = System Default (None passed to sounddevice — OS chooses the output)
@@ -503,8 +699,9 @@ class SynthEngine:
 
         self.waveform = "sine"
         self.octave = 0
-        self.noise_level = 0.0
         self.octave_enabled = True
+        self._refresh_master_consts()
+        self.noise_level = 0.0
         self.rank2_enabled = False
         self.rank2_waveform = "sawtooth"
         self.rank2_detune = 5.0
@@ -512,7 +709,7 @@ class SynthEngine:
         self.sine_mix = 0.0
 
         self.master_phase = 0.0
-        self.master_phase_inc = 2 * np.pi * 440.0 / self.sample_rate
+        self.master_phase_inc = _TWO_PI * 440.0 / self.sample_rate
 
         self.attack = 0.01
         self.decay = 0.2
@@ -578,8 +775,11 @@ class SynthEngine:
         # at startup and reused in-place each callback. Zero malloc/free in
         # the hot path prevents GC-pause deadline misses that cause clicks.
         _bs = self.buffer_size
-        self._cb_mixed_l  = np.zeros(_bs, dtype=np.float32)
-        self._cb_mixed_r  = np.zeros(_bs, dtype=np.float32)
+        # L and R mix buses are the two rows of one block so the voice mix-down
+        # can write both with a single matrix product.
+        self._cb_mixed_lr = np.zeros((2, _bs), dtype=np.float32)
+        self._cb_mixed_l  = self._cb_mixed_lr[0]
+        self._cb_mixed_r  = self._cb_mixed_lr[1]
         self._cb_cho_l    = np.zeros(_bs, dtype=np.float32)
         self._cb_cho_r    = np.zeros(_bs, dtype=np.float32)
         self._cb_wet_l    = np.zeros(_bs, dtype=np.float32)
@@ -604,9 +804,12 @@ class SynthEngine:
         # into the two halves used for r1 and r2 — halving generator
         # invocations versus the naive 4-call approach while preserving
         # full independence between L and R channels.  Pre-allocated buffers
-        # avoid heap allocation in the audio callback hot path.
-        self._dither_buf_l  = np.zeros(2 * _bs, dtype=np.float32)  # L channel: [r1 | r2]
-        self._dither_buf_r  = np.zeros(2 * _bs, dtype=np.float32)  # R channel: [r1 | r2]
+        # avoid heap allocation in the audio callback hot path.  The two
+        # channel buffers are rows of one block so the final clip can write
+        # both channels into the interleaved output in a single pass.
+        self._dither_buf    = np.zeros((2, 2 * _bs), dtype=np.float32)
+        self._dither_buf_l  = self._dither_buf[0]   # L channel: [r1 | r2]
+        self._dither_buf_r  = self._dither_buf[1]   # R channel: [r1 | r2]
         self._DITHER_AMP: float = 1.0 / 32768.0   # 1 LSB at 16-bit depth
         # Independent seeds for L and R; prefix 0xACC0 = ACCO(rdes)
         self._dither_rng_l  = np.random.default_rng(0xACC05000)
@@ -616,6 +819,21 @@ class SynthEngine:
         # Oversample-length index array: covers up to 4× oversampling so
         # _generate_waveform can compute phase arrays in-place without np.arange.
         self._cb_indices_4x = np.arange(_bs * 4, dtype=np.float32)
+        # Normalised-phase scratch for the same in-place path (callback-only).
+        self._cb_tnorm_4x   = np.zeros(_bs * 4, dtype=np.float32)
+        # Polyphase downsampler scratch: FIR history + one oversampled buffer,
+        # and one decimated output row per call site (rank 1, sine sub, rank 2)
+        # so the three outputs of a voice can be alive at the same time.
+        self._cb_ds_ext     = np.zeros(30 + _bs * 4, dtype=np.float32)
+        self._cb_ds_out     = np.zeros((3, _bs), dtype=np.float32)
+        # PolyBLEP edge mask and shifted-phase scratch, sized for a full
+        # voices × oversampled-samples block and reshaped to each call's shape.
+        self._cb_blep_mask  = np.zeros(self.num_voices * _bs * 4, dtype=bool)
+        self._cb_blep_half  = np.zeros(self.num_voices * _bs * 4, dtype=np.float32)
+        # Ladder thermal-noise floor: own generator (the audio thread never
+        # touches the global np.random state) and an output-length scratch row.
+        self._thermal_rng   = np.random.default_rng(0xACC05002)
+        self._cb_thermal    = np.zeros(_bs, dtype=np.float32)
 
         # Tier 2: pre-allocated ring-buffer write-index arrays.
         # Chorus and delay previously called .astype(np.int32) every buffer,
@@ -624,6 +842,11 @@ class SynthEngine:
         self._cb_idx_f       = np.zeros(_bs, dtype=np.float32)  # float temp for index math
         self._cb_cho_wr_idx  = np.zeros(_bs, dtype=np.int32)    # chorus write positions
         self._cb_dly_wr_idx  = np.zeros(_bs, dtype=np.int32)    # delay write positions
+        # Chorus tap scratch: LFO phase, integer read positions and one gathered
+        # tap, reused for every chorus voice.
+        self._cb_cho_ph      = np.zeros(_bs, dtype=np.float32)
+        self._cb_cho_rd_idx  = np.zeros(_bs, dtype=np.int32)
+        self._cb_cho_tap     = np.zeros(_bs, dtype=np.float32)
 
         # Tier 3: shared ramp buffers replacing np.linspace allocations.
         # _cb_ramp_buf   — primary scalar ramp (filter-switch, mute, onset, XF).
@@ -802,6 +1025,8 @@ class SynthEngine:
         # Eliminates click artifacts from filter/DC blocker transients during warm-up.
         # 1 second allows all DSP state (filters, DC blockers, LFO, arpeggiator) to fully settle.
         self._startup_silence_samples = int(self.sample_rate * 1.0)  # 1 second of silence
+        # Set once the callback thread has raised its own scheduling priority.
+        self._callback_priority_set = False
 
         # ── Output transformer simulation ──────────────────────────────────────
         # Models the subtle tonal shaping of an analog output transformer:
@@ -860,6 +1085,7 @@ class SynthEngine:
         self.pitch_bend = 0.0
         self.pitch_bend_target = 0.0
         self.pitch_bend_smoothing = 0.85
+        self._pb_mult = 1.0   # cached 2 ** (pitch_bend / 12), see _update_voice_frequencies
         self.mod_wheel = 0.0
 
         # ── Oversampling configuration ─────────────────────────────────────────
@@ -889,7 +1115,22 @@ class SynthEngine:
             self._arm_slow_cb_count = 0  # callbacks that used >50% of deadline
             self._arm_cb_count     = 0   # total callbacks processed
 
-        self.voices: List[Voice] = [Voice(self.sample_rate, i, _bs) for i in range(self.num_voices)]
+        # Per-voice final output (post DC blocker) as one voice-major block:
+        # row i belongs to self.voices[i].  Scalar voice state stays on the Voice
+        # objects (attribute access beats array indexing from Python), while the
+        # sample buffers that cross-voice stages read are laid out contiguously.
+        self._voice_out_mat = np.zeros((self.num_voices, _bs), dtype=np.float32)
+        self.voices: List[Voice] = [Voice(self.sample_rate, i, _bs, out_buf=self._voice_out_mat[i])
+                                    for i in range(self.num_voices)]
+        # Mix-down scratch: rendered voices' rows gathered contiguously, and
+        # their (L, R) gain columns, so the stereo mix is one (2 × n) @ (n × N)
+        # product instead of four ufunc calls per voice.
+        self._cb_mix_rows = np.zeros((self.num_voices, _bs), dtype=np.float32)
+        self._cb_mix_gain = np.zeros((2, self.num_voices), dtype=np.float32)
+        # Per-row inputs and (z, last x, last y) state for the numba DC blocker.
+        self._cb_dc_rows  = np.zeros(self.num_voices, dtype=np.int64)
+        self._cb_dc_coeff = np.zeros(self.num_voices)
+        self._cb_dc_state = np.zeros((self.num_voices, 3))
 
         # Ghost voice pool: pre-allocated extra voices that hold release tails from
         # stolen POLY voices.  When a real voice is stolen while still audible, its
@@ -902,12 +1143,46 @@ class SynthEngine:
             Voice(self.sample_rate, self.num_voices + i, _bs)
             for i in range(_ghost_count)
         ]
+        # Voice-major oscillator scratch for _generate_waveform_voices: room for
+        # one row per voice slot at 4× oversampling.  Kept flat and reshaped to
+        # each call's (voices, samples) shape so the block is contiguous: ufuncs
+        # over a strided sub-block go through NumPy's buffered iterator, which
+        # allocates on every call.  Rows stay valid for the whole callback, so
+        # each voice's chain can work on its row in place.
+        self._cb_osc_flat   = np.zeros(self.num_voices * _bs * 4, dtype=np.float32)
+        self._cb_phase_flat = np.zeros(self.num_voices * _bs * 4, dtype=np.float32)
+        self._cb_tnorm_flat = np.zeros(self.num_voices * _bs * 4, dtype=np.float32)
+        self._cb_osc_inc   = np.zeros((self.num_voices, 1), dtype=np.float32)
+        self._cb_osc_start = np.zeros((self.num_voices, 1), dtype=np.float32)
+        self._cb_osc_dphi  = np.zeros((self.num_voices, 1), dtype=np.float32)
+        # Per-slot mix gains held engine-side as parallel arrays (structure of
+        # arrays) rather than re-derived from each Voice every buffer.  Pan is
+        # fixed per slot, so constant-power L/R gains are computed once here.
+        # The UNISON table maps slot index to a left-to-right spread and folds
+        # in the 1/sqrt(N) stack normalisation.  Stored as Python floats so the
+        # float32 voice buffers are not promoted to float64 when scaled.
+        _pan_ang = np.array([v.pan for v in self.voices]) * (np.pi / 2)
+        self._pan_gain_l: list = np.cos(_pan_ang).tolist()
+        self._pan_gain_r: list = np.sin(_pan_ang).tolist()
+        _uni_ang = np.arange(self.num_voices) / max(self.num_voices - 1, 1) * (np.pi / 2)
+        _uni_scale = 1.0 / math.sqrt(self.num_voices)
+        self._unison_gain_l: list = (np.cos(_uni_ang) * _uni_scale).tolist()
+        self._unison_gain_r: list = (np.sin(_uni_ang) * _uni_scale).tolist()
         # Maximum release time (seconds) allowed for a ghost voice.
         # Keeps tails short enough to free the slot quickly for the next steal.
         self._GHOST_RELEASE_CAP: float = 0.08   # 80ms
 
+        # POLY note -> voice map so retrigger and release are O(1) lookups instead
+        # of scans over self.voices.  Entries are validated on read (the voice may
+        # have been reset or stolen since), so stale entries are harmless.
+        # _note_map_dups is set when a mode switch leaves one note on several
+        # active voices (UNISON -> POLY); release then falls back to a full scan.
+        self._note_to_voice: dict = {}
+        self._note_map_dups: bool = False
+
         self.held_notes: set = set()
-        self.midi_event_queue = queue.Queue()
+        # Lock-free FIFO: UI/MIDI threads put(), the audio callback drains.
+        self.midi_event_queue = EventQueue()
 
         # Initialize polyphase downsampling filter for oversampling
         self._create_polyphase_filter()
@@ -951,11 +1226,8 @@ class SynthEngine:
                     else:
                         print("[audio] ARM: bcm2835 headphone device not found, using ALSA default", flush=True)
 
-                # ARM: use an explicit numeric latency that matches the buffer
-                # size so PortAudio doesn't add a second layer of buffering on
-                # top of our blocksize.  'high' is vague and driver-dependent.
-                _latency = (self.buffer_size / self.sample_rate) if self._IS_ARM else 'low'
-                self.stream = sd.OutputStream(
+                _latency, _extra = self._stream_latency_settings(device_index)
+                _stream_kwargs = dict(
                     samplerate=self.sample_rate,
                     blocksize=self.buffer_size,
                     device=device_index,
@@ -964,9 +1236,17 @@ class SynthEngine:
                     callback=self._audio_callback,
                     latency=_latency,
                 )
+                try:
+                    self.stream = sd.OutputStream(extra_settings=_extra, **_stream_kwargs)
+                except Exception:
+                    if _extra is None:
+                        raise
+                    # Exclusive mode refused (device busy or format unsupported):
+                    # fall back to the normal shared-mode stream.
+                    print("[audio] WASAPI exclusive mode unavailable, using shared mode", flush=True)
+                    self.stream = sd.OutputStream(**_stream_kwargs)
                 self.stream.start()
                 self.running = True
-                self._elevate_audio_priority()
 
                 actual_blocksize = self.stream.blocksize
                 if self._IS_ARM:
@@ -1014,7 +1294,7 @@ class SynthEngine:
         at Q=1.2 (prevents runaway instability that a symmetric Q cascade would have).
         """
         sr = self.sample_rate
-        f0 = float(np.clip(cutoff, 20.0, sr * 0.45))
+        f0 = min(sr * 0.45, max(20.0, float(cutoff)))
         # Stage 1: carries the resonance peak (Q scales aggressively with resonance).
         Q1 = max(0.5, 0.707 + resonance * 11.293)   # 0.707 → 12.0
         # Stage 2: near-Butterworth, just adds rolloff slope.
@@ -1045,7 +1325,7 @@ class SynthEngine:
         resonance 0.0 -> Q=0.707 (Butterworth), 1.0 -> Q=10.0 (near self-oscillation).
         """
         sr = self.sample_rate
-        f0 = float(np.clip(cutoff, 20.0, sr * 0.45))
+        f0 = min(sr * 0.45, max(20.0, float(cutoff)))
         Q = max(0.5, 0.707 + resonance * 9.293)
         w0 = 2.0 * math.pi * f0 / sr
         cos_w0 = math.cos(w0)
@@ -1059,6 +1339,39 @@ class SynthEngine:
         a2 = 1.0 - alpha
         return np.array([[b0/a0, b1/a0, b2/a0, 1.0, a1/a0, a2/a0]])
 
+    def _stream_latency_settings(self, device_index: Optional[int]) -> tuple:
+        """Return (latency, extra_settings) for the sounddevice OutputStream.
+
+        ARM: an explicit numeric latency that matches the buffer size so
+        PortAudio doesn't add a second layer of buffering on top of our
+        blocksize.  'high' is vague and driver-dependent.
+
+        Desktop: PortAudio's 'low' preset unless ACORDES_AUDIO_LATENCY gives a
+        value in milliseconds (e.g. ACORDES_AUDIO_LATENCY=5), which lets small
+        buffer sizes actually reach the driver instead of being padded out.
+        On Windows, ACORDES_WASAPI_EXCLUSIVE=1 requests WASAPI exclusive mode
+        for a WASAPI device, bypassing the shared-mode mixer (~10 ms less
+        output latency).  The caller falls back to shared mode if refused.
+        """
+        if self._IS_ARM:
+            return self.buffer_size / self.sample_rate, None
+        latency = 'low'
+        _env_lat = os.environ.get("ACORDES_AUDIO_LATENCY", "")
+        if _env_lat:
+            try:
+                latency = max(0.0, float(_env_lat)) / 1000.0
+            except ValueError:
+                pass
+        extra = None
+        if sys.platform == "win32" and os.environ.get("ACORDES_WASAPI_EXCLUSIVE") == "1":
+            try:
+                dev = sd.query_devices(device_index, 'output')
+                if 'WASAPI' in sd.query_hostapis(dev['hostapi'])['name']:
+                    extra = sd.WasapiSettings(exclusive=True)
+            except Exception:
+                pass
+        return latency, extra
+
     def _find_arm_headphone_device(self) -> Optional[int]:
         """Scan the sounddevice device list for the bcm2835 headphone output.
 
@@ -1083,11 +1396,17 @@ class SynthEngine:
         """Raise process/thread scheduling priority so the PortAudio callback
         thread is not preempted by the Textual UI thread during widget rebuilds.
 
+        The thread-level calls act on the calling thread, so this is invoked
+        from _audio_callback (once, on the first buffer) rather than from the
+        thread that opened the stream.
+
         Each OS has its own API — all three are handled:
 
-        Windows  — SetPriorityClass(ABOVE_NORMAL_PRIORITY_CLASS) on the process.
-                   No admin rights required.  ABOVE_NORMAL sits one step above
-                   normal apps without needing the admin-gated REALTIME class.
+        Windows  — SetPriorityClass(ABOVE_NORMAL_PRIORITY_CLASS) on the process,
+                   then SetThreadPriority(THREAD_PRIORITY_TIME_CRITICAL) on the
+                   callback thread.  No admin rights required.  ABOVE_NORMAL
+                   sits one step above normal apps without needing the
+                   admin-gated REALTIME class.
 
         Linux    — Try SCHED_FIFO real-time scheduling for the current thread
                    via ctypes → pthread_setschedparam (requires CAP_SYS_NICE or
@@ -1106,12 +1425,16 @@ class SynthEngine:
         try:
             if sys.platform == "win32":
                 # ----------------------------------------------------------------
-                # Windows: elevate the whole process priority class.
+                # Windows: elevate the whole process priority class, then the
+                # callback thread within it.
                 # ABOVE_NORMAL_PRIORITY_CLASS = 0x00008000
+                # THREAD_PRIORITY_TIME_CRITICAL = 15
                 # ----------------------------------------------------------------
                 ABOVE_NORMAL_PRIORITY_CLASS = 0x00008000
-                handle = ctypes.windll.kernel32.GetCurrentProcess()
-                ctypes.windll.kernel32.SetPriorityClass(handle, ABOVE_NORMAL_PRIORITY_CLASS)
+                THREAD_PRIORITY_TIME_CRITICAL = 15
+                kernel32 = ctypes.windll.kernel32
+                kernel32.SetPriorityClass(kernel32.GetCurrentProcess(), ABOVE_NORMAL_PRIORITY_CLASS)
+                kernel32.SetThreadPriority(kernel32.GetCurrentThread(), THREAD_PRIORITY_TIME_CRITICAL)
 
             elif sys.platform == "linux":
                 # ----------------------------------------------------------------
@@ -1127,8 +1450,12 @@ class SynthEngine:
                     class SchedParam(ctypes.Structure):
                         _fields_ = [("sched_priority", ctypes.c_int)]
                     param = SchedParam(RT_PRIORITY)
-                    # 0 = current thread
-                    ret = libpthread.pthread_setschedparam(0, SCHED_FIFO, ctypes.byref(param))
+                    # pthread_t is an opaque handle, not 0 for "self": ask for it.
+                    libpthread.pthread_self.restype = ctypes.c_ulong
+                    libpthread.pthread_setschedparam.argtypes = [
+                        ctypes.c_ulong, ctypes.c_int, ctypes.POINTER(SchedParam)]
+                    ret = libpthread.pthread_setschedparam(
+                        libpthread.pthread_self(), SCHED_FIFO, ctypes.byref(param))
                     if ret != 0:
                         raise OSError(ret, "pthread_setschedparam failed")
                 except Exception:
@@ -1255,15 +1582,27 @@ class SynthEngine:
         self._arp_gate_samples = max(1, int(self._arp_step_samples * float(self.arp_gate)))
 
     def _midi_to_frequency(self, midi_note: int) -> float:
+        if 0 <= midi_note < 128:
+            return _MIDI_FREQ[midi_note]
+        # Arp octave range can push a note past 127; keep the exact formula there.
         return 440.0 * (2.0 ** ((midi_note - 69) / 12.0))
 
     def _update_voice_frequencies(self):
+        pb_prev = self.pitch_bend
         if abs(self.pitch_bend - self.pitch_bend_target) > 0.0001:
             self.pitch_bend = self.pitch_bend * self.pitch_bend_smoothing + self.pitch_bend_target * (1.0 - self.pitch_bend_smoothing)
         else: self.pitch_bend = self.pitch_bend_target
+        # The bend ratio is recomputed only when the bend moves.  With the wheel
+        # at rest (ratio exactly 1.0) every writer of v.frequency already keeps
+        # it equal to base_frequency, so the per-voice pass is skipped entirely.
+        if self.pitch_bend != pb_prev:
+            self._pb_mult = 2.0 ** (self.pitch_bend / 12.0)
+        elif self._pb_mult == 1.0:
+            return
+        pb_mult = self._pb_mult
         for v in self.voices:
             if v.base_frequency is not None and (v.note_active or v.is_releasing):
-                v.frequency = v.base_frequency * (2.0 ** (self.pitch_bend / 12.0))
+                v.frequency = v.base_frequency * pb_mult
 
     def _generate_metro_clicks(self):
         """Generate simple metronome clicks using white noise with decay.
@@ -1311,9 +1650,13 @@ class SynthEngine:
 
         # Normalize so passband gain is ~1.0 at DC
         self._downsample_filter_taps = (h_windowed / np.sum(h_windowed)).astype(np.float32)
+        # Reversed copy for the strided dot product in _downsample_polyphase_signal
+        # (convolution is correlation with the reversed kernel).
+        self._downsample_taps_rev = self._downsample_filter_taps[::-1].copy()
 
     def _downsample_polyphase_signal(self, oversampled: np.ndarray, downsample_factor: int = 4,
-                                     history: np.ndarray = None) -> np.ndarray:
+                                     history: np.ndarray = None,
+                                     out: Optional[np.ndarray] = None) -> np.ndarray:
         """ABOUTME: Polyphase downsampling: convolve with lowpass filter, decimate by factor.
         ABOUTME: Input: oversampled array at 192 kHz, Output: decimated array at 48 kHz."""
         if not self.ENABLE_OVERSAMPLING or self._downsample_filter_taps is None:
@@ -1323,6 +1666,27 @@ class SynthEngine:
         n_taps = len(self._downsample_filter_taps)
         history_len = n_taps - 1   # 30 samples for a 31-tap filter
 
+        ext_buf = self._cb_ds_ext
+        if (history is not None and out is not None and len(out) >= expected_len
+                and len(history) == history_len
+                and len(ext_buf) >= history_len + len(oversampled)):
+            # Allocation-free path: history and the new buffer are copied into
+            # persistent scratch, and only the kept output phase is computed.
+            # Each row of the strided view is the window under one decimated
+            # output sample, so one dot product replaces the full-rate
+            # convolution that threw three of every four samples away.
+            ext = ext_buf[:history_len + len(oversampled)]
+            ext[:history_len] = history
+            ext[history_len:] = oversampled
+            step = ext.strides[0]
+            windows = np.lib.stride_tricks.as_strided(
+                ext, shape=(expected_len, n_taps),
+                strides=(step * downsample_factor, step), writeable=False)
+            out = out[:expected_len]
+            np.dot(windows, self._downsample_taps_rev, out=out)
+            history[:] = oversampled[-history_len:]
+            return out
+
         if history is not None:
             # Prepend the caller-supplied FIR history so each buffer boundary uses
             # actual past samples instead of zero-padding.  mode='valid' produces
@@ -1417,7 +1781,7 @@ class SynthEngine:
         effective_sample_rate = self.sample_rate * oversample_factor
         effective_num_samples = num_samples * oversample_factor
 
-        phase_inc = np.float32(2.0 * np.pi * frequency / effective_sample_rate)
+        phase_inc = np.float32(frequency * (_TWO_PI / effective_sample_rate))
 
         # Phase accumulation — use pre-allocated buffer when supplied to avoid
         # np.arange + broadcast allocation (~7 KB per call at 4× oversampling).
@@ -1427,136 +1791,185 @@ class SynthEngine:
             # pre-built oversample-length index array (self._cb_indices_4x).
             np.multiply(self._cb_indices_4x[:effective_num_samples], phase_inc, out=phases)
             phases += np.float32(start_phase)
+            # Normalised phase t_norm = (phase / 2π) % 1  — used by triangle/saw/square.
+            # Written into the shared scratch buffer so the in-place path allocates nothing.
+            # The sine shapes never read it (sine only uses it as scratch).
+            t_norm = self._cb_tnorm_4x[:effective_num_samples]
+            if waveform not in _SINE_WAVEFORMS:
+                np.multiply(phases, np.float32(_INV_TWO_PI), out=t_norm)
+                np.mod(t_norm, np.float32(1.0), out=t_norm)
         else:
             phases = start_phase + np.arange(effective_num_samples) * phase_inc
-
-        # Normalised phase t_norm = (phase / 2π) % 1  — used by triangle/saw/square.
-        # Uses pre-allocated _v_tnorm_buf when _phases buffer is the voice's own array.
-        t_norm = (phases / np.float32(2.0 * np.pi)) % np.float32(1.0)
+            t_norm = (phases / np.float32(_TWO_PI)) % np.float32(1.0)
 
         # Output buffer: use caller-supplied pre-allocated array when provided.
         if _out is not None and len(_out) >= effective_num_samples:
             samples = _out[:effective_num_samples]
-            if waveform == "pure_sine":
-                np.sin(phases, out=samples)
-            elif waveform == "sine":
-                np.sin(phases, out=samples)
-                samples *= np.float32(0.99)
-                # Compute 2nd harmonic into t_norm (reuse as temp since it's been read)
-                np.multiply(phases, np.float32(2.0), out=t_norm)
-                np.sin(t_norm, out=t_norm)
-                samples += t_norm * np.float32(0.01)
-                # Restore t_norm for PolyBLEP (not needed for sine — PolyBLEP skips sine)
-            elif waveform == "triangle":
-                np.subtract(t_norm, np.float32(0.5), out=samples)
-                np.abs(samples, out=samples)
-                samples *= np.float32(4.0)
-                samples -= np.float32(1.0)
-            elif waveform == "square":
-                np.sin(phases, out=samples)
-                np.sign(samples, out=samples)
-            else:
-                # Sawtooth (default)
-                np.multiply(t_norm, np.float32(2.0), out=samples)
-                samples -= np.float32(1.0)
+            _WAVE_SHAPERS.get(waveform, _shape_sawtooth)(phases, t_norm, samples)
         else:
             if waveform == "pure_sine":
                 samples = np.sin(phases)
             elif waveform == "sine":
                 # Vintage-warm sine: fundamental + 1% 2nd harmonic for subtle colour.
-                samples = np.sin(phases) * 0.99 + np.sin(2.0 * phases) * 0.01
+                samples = np.sin(phases) * (0.99 + 0.02 * np.cos(phases))
             elif waveform == "triangle":
                 samples = 4.0 * np.abs(t_norm - 0.5) - 1.0
             elif waveform == "square":
-                samples = np.where(np.sin(phases) >= 0, 1.0, -1.0)
+                samples = np.where(t_norm < 0.5, 1.0, -1.0)
             else:
                 # Sawtooth (default)
                 samples = 2.0 * t_norm - 1.0
 
         # Apply PolyBLEP anti-aliasing to band-limited waveforms.
         # Skipped on ARM: single-core Pi 4 cannot afford it without xruns.
-        if not self._IS_ARM and waveform in ["sawtooth", "square", "triangle"]:
-            samples = self._apply_polyblep(waveform, samples, phases, frequency, effective_num_samples, effective_sample_rate)
+        if not self._IS_ARM and waveform in _POLYBLEP_WAVEFORMS:
+            samples = self._apply_polyblep(waveform, samples, phases, frequency, effective_num_samples, effective_sample_rate, t_norm=t_norm)
+
+        final_phase = float((start_phase + effective_num_samples * phase_inc) % _TWO_PI)
+        # copy=False: the in-place path already produced float32, so this is a
+        # no-op there and only converts the float64 fallback arrays.
+        return samples.astype(np.float32, copy=False), final_phase
+
+    def _generate_waveform_voices(self, waveform: str, voices: list, num_samples: int,
+                                  oversample_factor: int = 1) -> np.ndarray:
+        """Primary oscillators for several voices in one pass, one row per voice.
+
+        voices is the callback's render list of (slot, voice, frequency).  Same
+        phase math, shapes and PolyBLEP as _generate_waveform, but every NumPy op
+        runs over a voices × samples block, so the per-call overhead is paid once
+        per buffer instead of once per voice.  Advances each voice's phase and
+        returns a view into the engine's oscillator matrix.  Pitched waveforms only.
+        """
+        n = len(voices)
+        effective_sample_rate = self.sample_rate * oversample_factor
+        effective_num_samples = num_samples * oversample_factor
+        inc_scale = _TWO_PI / effective_sample_rate
+        inv_sr = 1.0 / effective_sample_rate
+
+        inc = self._cb_osc_inc[:n]
+        start = self._cb_osc_start[:n]
+        dphi = self._cb_osc_dphi[:n]
+        for r, (_vi, v, freq) in enumerate(voices):
+            phase_inc = np.float32(freq * inc_scale)
+            inc[r, 0] = phase_inc
+            start[r, 0] = v.phase
+            dphi[r, 0] = freq * inv_sr
+            v.phase = float((v.phase + effective_num_samples * phase_inc) % _TWO_PI)
+
+        shape = (n, effective_num_samples)
+        size = n * effective_num_samples
+        phases = self._cb_phase_flat[:size].reshape(shape)
+        np.multiply(self._cb_indices_4x[:effective_num_samples], inc, out=phases)
+        phases += start
+        t_norm = self._cb_tnorm_flat[:size].reshape(shape)
+        if waveform not in _SINE_WAVEFORMS:
+            np.multiply(phases, np.float32(_INV_TWO_PI), out=t_norm)
+            np.mod(t_norm, np.float32(1.0), out=t_norm)
+
+        samples = self._cb_osc_flat[:size].reshape(shape)
+        _WAVE_SHAPERS.get(waveform, _shape_sawtooth)(phases, t_norm, samples)
+        if not self._IS_ARM and waveform in _POLYBLEP_WAVEFORMS:
+            self._apply_polyblep(waveform, samples, phases, dphi, effective_num_samples,
+                                 effective_sample_rate, t_norm=t_norm)
+        return samples
 
-        final_phase = float((start_phase + effective_num_samples * phase_inc) % (2.0 * np.pi))
-        return samples.astype(np.float32), final_phase
+    def _apply_polyblep(self, waveform: str, samples: np.ndarray, phase: np.ndarray, frequency, num_samples: int, sample_rate: float = None, t_norm: Optional[np.ndarray] = None) -> np.ndarray:
+        """Apply PolyBLEP (Polynomial BLEP) anti-aliasing correction to sawtooth, square, and triangle.
 
-    def _apply_polyblep(self, waveform: str, samples: np.ndarray, phase: np.ndarray, frequency: float, num_samples: int, sample_rate: float = None) -> np.ndarray:
-        """Apply PolyBLEP (Polynomial BLEP) anti-aliasing correction to sawtooth, square, and triangle."""
+        frequency may be a scalar, or a (voices, 1) float32 column of per-row
+        normalised increments (dphi) when samples is a voices × samples block.
+        """
         if sample_rate is None:
             sample_rate = self.sample_rate
-        phase_inc = 2 * np.pi * frequency / sample_rate
-        dphi = phase_inc / (2 * np.pi)  # Normalized phase increment
-
-        # Normalized phase 0..1
-        t_norm = (phase % (2 * np.pi)) / (2 * np.pi)
+        per_row = isinstance(frequency, np.ndarray)
+        if per_row:
+            dphi = np.broadcast_to(frequency, samples.shape)
+        else:
+            dphi = frequency / sample_rate  # Normalized phase increment
+
+        # Normalized phase 0..1 (reuse the caller's array when it already has one)
+        if t_norm is None:
+            t_norm = (phase % _TWO_PI) * _INV_TWO_PI
+
+        # Edge masks go into one pre-allocated boolean buffer (each mask is
+        # dead before the next is built); oversized calls allocate instead.
+        n_all = samples.size
+        pooled = n_all <= self._cb_blep_mask.size
+        mask_buf = self._cb_blep_mask[:n_all].reshape(samples.shape) if pooled else None
+
+        # Rising-edge correction near phase 0, shared by all three shapes.
+        # The residuals are quadratics in u = t/dphi.  Each is evaluated in
+        # factored form on the one temporary the masked read produces, with
+        # in-place updates, rather than as a sum of separately allocated
+        # terms:  -0.5·u² + u - 0.5 = -0.5·(u - 1)².
+        mask_rise = np.less(t_norm, dphi, out=mask_buf)
+        d = dphi[mask_rise] if per_row else dphi
+        polyblep_rise = t_norm[mask_rise] / d
+        polyblep_rise -= 1.0
+        polyblep_rise *= polyblep_rise
+        polyblep_rise *= -0.5
 
         if waveform == "sawtooth":
-            # Apply PolyBLEP at the sawtooth discontinuity (every period at phase 0)
-            # Rising edge correction near phase 0
-            mask_rise = t_norm < dphi
-            polyblep_rise = -0.5 * (t_norm[mask_rise] / dphi) ** 2 + t_norm[mask_rise] / dphi - 0.5
             samples[mask_rise] += polyblep_rise
 
-            # Falling edge correction near phase 1 (2π)
-            mask_fall = t_norm > (1.0 - dphi)
-            polyblep_fall = 0.5 * ((1.0 - t_norm[mask_fall]) / dphi) ** 2 - (1.0 - t_norm[mask_fall]) / dphi + 0.5
+            # Falling edge correction near phase 1 (2π):
+            # with w = (1 - t)/dphi,  0.5·w² - w + 0.5 = 0.5·(w - 1)².
+            # Threshold from the (voices, 1) column, not the broadcast block.
+            mask_fall = np.greater(t_norm, 1.0 - (frequency if per_row else dphi),
+                                   out=mask_buf)
+            d = dphi[mask_fall] if per_row else dphi
+            polyblep_fall = np.subtract(1.0, t_norm[mask_fall])
+            polyblep_fall /= d
+            polyblep_fall -= 1.0
+            polyblep_fall *= polyblep_fall
+            polyblep_fall *= 0.5
             samples[mask_fall] += polyblep_fall
-        elif waveform == "square":
-            # Square wave has discontinuities at 0 and 0.5 (rising and falling edges)
-            # Rising edge at 0
-            mask_rise = t_norm < dphi
-            polyblep_rise = -0.5 * (t_norm[mask_rise] / dphi) ** 2 + t_norm[mask_rise] / dphi - 0.5
+        elif waveform in ("square", "triangle"):
+            # Square has value discontinuities at 0 and 0.5; triangle has slope
+            # discontinuities there, corrected at twice the scale for its
+            # steeper slopes.
+            scale = 1.0 if waveform == "square" else 2.0
+            if scale != 1.0:
+                polyblep_rise *= scale
             samples[mask_rise] += polyblep_rise
 
-            # Falling edge at 0.5
-            t_norm_half = (t_norm - 0.5) % 1.0
-            mask_fall = t_norm_half < dphi
-            polyblep_fall = 0.5 * ((t_norm_half[mask_fall]) / dphi) ** 2 - (t_norm_half[mask_fall]) / dphi - 0.5
+            # Falling edge at 0.5:  0.5·u² - u - 0.5 = 0.5·(u - 1)² - 1.
+            t_norm_half = (self._cb_blep_half[:n_all].reshape(samples.shape) if pooled
+                           else np.empty_like(t_norm))
+            np.subtract(t_norm, 0.5, out=t_norm_half)
+            np.mod(t_norm_half, 1.0, out=t_norm_half)
+            mask_fall = np.less(t_norm_half, dphi, out=mask_buf)
+            d = dphi[mask_fall] if per_row else dphi
+            polyblep_fall = t_norm_half[mask_fall] / d
+            polyblep_fall -= 1.0
+            polyblep_fall *= polyblep_fall
+            polyblep_fall *= 0.5
+            polyblep_fall -= 1.0
+            if scale != 1.0:
+                polyblep_fall *= scale
             samples[mask_fall] -= polyblep_fall
-        elif waveform == "triangle":
-            # Triangle has discontinuities in its derivative at 0 and 0.5
-            # Rising slope edge at 0
-            mask_rise = t_norm < dphi
-            polyblep_rise = -0.5 * (t_norm[mask_rise] / dphi) ** 2 + t_norm[mask_rise] / dphi - 0.5
-            samples[mask_rise] += 2.0 * polyblep_rise  # Scale for steeper slopes
-
-            # Falling slope edge at 0.5
-            t_norm_half = (t_norm - 0.5) % 1.0
-            mask_fall = t_norm_half < dphi
-            polyblep_fall = 0.5 * ((t_norm_half[mask_fall]) / dphi) ** 2 - (t_norm_half[mask_fall]) / dphi - 0.5
-            samples[mask_fall] -= 2.0 * polyblep_fall
 
         return samples
 
     def _apply_envelope(self, voice: Voice, samples: np.ndarray, num_samples: int,
                         _env_buf: Optional[np.ndarray] = None,
                         _times_buf: Optional[np.ndarray] = None) -> np.ndarray:
-        dt = np.float32(1.0 / self.sample_rate)
-        VEL_C, VEL_F = 1.3, 0.15
-        v_scaled = VEL_F + (1.0 - VEL_F) * (voice.velocity ** VEL_C)
-        v_int = 1.0 * v_scaled
-
-        # Time array: voice.envelope_time + [0, dt, 2dt, …, (n-1)*dt].
-        # Use pre-allocated buffer when supplied; otherwise allocate (fallback).
-        if _times_buf is not None and len(_times_buf) >= num_samples:
-            times = _times_buf[:num_samples]
-            # Inline linspace to avoid _fill_linspace function-call overhead (called 8x per buffer).
-            t_start = np.float32(voice.envelope_time)
-            if num_samples > 1:
-                np.multiply(self._cb_indices[:num_samples], dt, out=times)
-                times += t_start
-            else:
-                times[0] = t_start
-        else:
-            times = voice.envelope_time + np.arange(num_samples) * dt
-
-        # Envelope output — use pre-allocated buffer when supplied.
+        dt = self._env_dt
+        v_int = voice.velocity_curve()
+
+        # Envelope time of the first and last sample in this buffer, as the
+        # float32 values of the ramp t_start + i*dt.  The stages are slices, so
+        # the ramp itself is only built (by _envelope_times) for the short
+        # de-click and steal blends that read it sample by sample.
+        t_start = np.float32(voice.envelope_samples / self.sample_rate)
+        t_last = np.float32(num_samples - 1) * dt + t_start
+
+        # Envelope output — use pre-allocated buffer when supplied.  Both
+        # stage branches below write every sample.
         if _env_buf is not None and len(_env_buf) >= num_samples:
             envelope = _env_buf[:num_samples]
-            envelope.fill(0.0)
         else:
-            envelope = np.zeros(num_samples, dtype=np.float32)
+            envelope = np.empty(num_samples, dtype=np.float32)
         if voice.is_releasing:
             # rel_mod scales release time by note-off velocity (soft release -> longer tail).
             # time_const is the RC time constant of the exponential decay — the /4 divisor
@@ -1567,55 +1980,133 @@ class SynthEngine:
             # voices don't beat together long enough to produce an audible AM artifact.
             if voice.release_time_cap > 0.0:
                 time_const = min(time_const, voice.release_time_cap)
-            envelope = voice.release_start_level * np.exp(-times / time_const)
+            # exp(-(t0 + i·dt)/tc) = exp(-t0/tc) · exp(-i·dt/tc): the per-sample
+            # factor depends only on tc, so it is cached on the voice and each
+            # buffer costs one scalar exp and one multiply pass.
+            curve = voice._v_rel_curve
+            if voice._v_rel_curve_tc != time_const:
+                np.multiply(self._cb_indices[:len(curve)], np.float32(-dt / time_const), out=curve)
+                np.exp(curve, out=curve)
+                voice._v_rel_curve_tc = time_const
+            np.multiply(curve[:num_samples],
+                        voice.release_start_level * math.exp(-float(t_start) / time_const),
+                        out=envelope)
             ANTI_R = 0.002
-            if times[0] < ANTI_R:
-                mask = times < ANTI_R
-                p = times[mask] / ANTI_R
-                envelope[mask] = voice.release_start_level * (1.0 - p) + envelope[mask] * p
-            voice.envelope_time = times[-1] + dt
+            if t_start < ANTI_R:
+                times = self._envelope_times(t_start, dt, num_samples, _times_buf)
+                self._blend_envelope_head(envelope, times, ANTI_R, voice.release_start_level)
+            voice.envelope_samples += num_samples
             # Use time_const (not self.release) for the safety timeout so that
             # soft note-off velocities (rel_mod > 1) don't cause an audible hard
             # cut before the exponential reaches inaudible levels.
             # 10 time constants → exp(-10) ≈ 0.00005, well below the 0.001 threshold.
-            if envelope[-1] < 0.001 or times[-1] > time_const * 10: voice.reset()
+            if envelope[-1] < 0.001 or t_last > time_const * 10: voice.reset()
         elif voice.note_active:
-            atk_mask = times < self.attack
-            if self.attack > 0: envelope[atk_mask] = (times[atk_mask] / self.attack) * v_int
-            else: envelope[atk_mask] = v_int
+            # Stage boundaries as sample offsets into this buffer.  Sample i is
+            # at envelope position e0 + i, so "t < attack" is i < att_n - e0 and each
+            # stage is a plain slice: no boolean masks, no fancy-index copies.
+            sr = self.sample_rate
+            e0 = voice.envelope_samples
+            idx = self._cb_indices
+            att_n = int(round(self.attack * sr))
+            dec_n = int(round((self.attack + self.decay) * sr))
+            att_end = min(num_samples, max(0, att_n - e0))
+            dec_stop = min(num_samples, max(att_end, dec_n - e0))
+            if att_end:
+                seg = envelope[:att_end]
+                np.add(idx[:att_end], np.float32(e0), out=seg)
+                seg *= np.float32(v_int / att_n)
             if voice.steal_start_level > 0.001:
                 # 8ms linear crossfade from the stolen note's last level to the new
                 # attack — long enough to be inaudible, short enough not to smear the
-                # new note's transient.
+                # new note's transient.  Blended over the attack values only:
+                # the decay and sustain slices below overwrite the rest.
                 CROSS = 0.008
-                if times[0] < CROSS:
-                    mask = times < CROSS
-                    p = times[mask] / CROSS          # linear 0->1 over 8ms
-                    envelope[mask] = voice.steal_start_level * (1.0 - p) + envelope[mask] * p
-                    if times[-1] >= CROSS: voice.steal_start_level = 0.0
-            dec_end = self.attack + self.decay
-            dec_mask = (times >= self.attack) & (times < dec_end)
-            if self.decay > 0:
-                p = (times[dec_mask] - self.attack) / self.decay
-                envelope[dec_mask] = v_int * (1.0 - p * (1.0 - self.sustain))
-            else: envelope[dec_mask] = v_int * self.sustain
-            envelope[times >= dec_end] = v_int * self.sustain
-            # Feature 2: Sustain capacitor leakage — dielectric loss on the hold
-            # capacitor. Very long sustained notes drift slightly downward over
-            # ~6.5 seconds, flooring at 65% of the sustain level. Models the slow
-            # charge bleed that occurs in real analog envelope generator hold stages.
-            if not voice.is_releasing:
-                sustain_mask = times >= dec_end
-                if sustain_mask.any():
-                    voice.sustain_cap = max(0.65, voice.sustain_cap - self._CAP_SUSTAIN_LEAK * num_samples)
-                    envelope[sustain_mask] *= voice.sustain_cap
+                if t_start < CROSS:
+                    times = self._envelope_times(t_start, dt, num_samples, _times_buf)
+                    self._blend_envelope_head(envelope, times, CROSS, voice.steal_start_level)
+                    if t_last >= CROSS: voice.steal_start_level = 0.0
+            if dec_stop > att_end:
+                # v_int · (1 - p·(1 - sustain)) with p = (e0 + i - A) / decay length.
+                seg = envelope[att_end:dec_stop]
+                np.add(idx[att_end:dec_stop], np.float32(e0 - att_n), out=seg)
+                seg *= np.float32(-v_int * (1.0 - self.sustain) / (dec_n - att_n))
+                seg += np.float32(v_int)
+            if dec_stop < num_samples:
+                # Feature 2: Sustain capacitor leakage — dielectric loss on the hold
+                # capacitor. Very long sustained notes drift slightly downward over
+                # ~6.5 seconds, flooring at 65% of the sustain level. Models the slow
+                # charge bleed that occurs in real analog envelope generator hold stages.
+                voice.sustain_cap = max(0.65, voice.sustain_cap - self._CAP_SUSTAIN_LEAK * num_samples)
+                envelope[dec_stop:] = v_int * self.sustain * voice.sustain_cap
             # DC blocker settling transient suppression is now handled by ONSET_RAMP
             # (frequency-adaptive linear fade-in applied to post-envelope signal).
             # Removed ANTI_I exponential envelope suppression to prevent interference
             # with the attack envelope and eliminate undesired dips at onset boundary.
-            voice.envelope_time = times[-1] + dt
+            voice.envelope_samples = e0 + num_samples
+        else:
+            envelope.fill(0.0)
         voice.last_envelope_level = envelope[-1]
-        return samples * envelope
+        # Envelope array is scratch (pre-allocated or freshly computed), so the
+        # product is written into it rather than into a new array.
+        np.multiply(samples, envelope, out=envelope)
+        return envelope
+
+    def _apply_onset_ramp(self, voice: Voice, samples: np.ndarray, frame_count: int) -> None:
+        """Multiply the head of a voice's post-envelope signal by its onset ramp.
+
+        Feature 4: RC gate curve.  The fade-in is an exponential RC charge
+        shape rather than a linear ramp: it models a capacitor on the gate
+        signal, with a fast initial rise and a gradual approach to 1.0 that
+        is characteristic of real analog gate circuitry.  The ramp is built
+        in the voice's pre-allocated buffer; samples past its end are left
+        untouched (gain 1.0).  No-op once the ramp has completed.
+        """
+        ONSET_RAMP = int(self.sample_rate * voice.onset_ms / 1000.0)
+        if voice.onset_samples >= ONSET_RAMP:
+            return
+        n = min(frame_count, ONSET_RAMP - voice.onset_samples)
+        ramp = self._fill_linspace(voice._v_onset_ramp,
+                                   voice.onset_samples / ONSET_RAMP,
+                                   min((voice.onset_samples + n) / ONSET_RAMP, 1.0), n)
+        ramp *= np.float32(-1.0 / self._CAP_GATE_TAU)
+        np.exp(ramp, out=ramp)
+        np.subtract(np.float32(1.0), ramp, out=ramp)
+        ramp /= np.float32(1.0 - math.exp(-1.0 / self._CAP_GATE_TAU))
+        samples[:n] *= ramp
+        voice.onset_samples += frame_count
+
+    def _envelope_times(self, t_start, dt, num_samples: int,
+                        _times_buf: Optional[np.ndarray] = None) -> np.ndarray:
+        """Envelope time ramp t_start + [0, dt, 2dt, …, (n-1)*dt] in float32.
+
+        Written into _times_buf when it is large enough; allocated otherwise.
+        """
+        if _times_buf is not None and len(_times_buf) >= num_samples:
+            times = _times_buf[:num_samples]
+            np.multiply(self._cb_indices[:num_samples], dt, out=times)
+            times += t_start
+            return times
+        return np.arange(num_samples, dtype=np.float32) * dt + t_start
+
+    @staticmethod
+    def _blend_envelope_head(envelope: np.ndarray, times: np.ndarray,
+                             span: float, level: float) -> None:
+        """Fade envelope in from a held level over its first span seconds.
+
+        times is ascending, so the samples with t < span are a prefix and the
+        blend is a slice rather than a boolean mask.  Each sample becomes
+        level * (1 - p) + envelope * p with p = t / span (linear 0->1).
+        times is scratch and is overwritten with p.
+        """
+        n = int(np.searchsorted(times, span))
+        p = times[:n]
+        p /= span
+        head = envelope[:n]
+        head *= p
+        np.subtract(1.0, p, out=p)
+        p *= level
+        head += p
 
     def _filter_process(self, samples: np.ndarray, cutoff: float, filter_type: str,
                         prev_state: float, res: float = 0.0,
@@ -1633,7 +2124,7 @@ class SynthEngine:
         feedback the original loop used, extended to one-buffer delay — inaudible
         at normal buffer sizes (256-512 samples).
         """
-        alpha   = float(np.clip(2 * np.pi * cutoff / self.sample_rate, 0.0, 1.0))
+        alpha   = min(1.0, max(0.0, cutoff * self._two_pi_over_sr))
         a1      = 1.0 - alpha
         res_fb  = res * 0.95
 
@@ -1697,15 +2188,15 @@ class SynthEngine:
         (alpha > 1.0 violates the stability condition of the discrete integrator).
         """
         sr = self.sample_rate
-        fc = float(np.clip(cutoff, 20.0, sr * 0.45))
+        fc = min(sr * 0.45, max(20.0, float(cutoff)))
         # Chamberlin/bilinear-adjacent coefficient: 2·sin(π·fc/sr) tracks the analog
         # prototype more accurately than the forward-Euler 2π·fc/sr, especially above
         # fc/sr ≈ 0.1 where the Euler form over-rotates and undershoots the true cutoff.
-        alpha = float(np.clip(2.0 * math.sin(math.pi * fc / sr), 0.0, 0.95))
+        alpha = min(0.95, max(0.0, 2.0 * math.sin(math.pi * fc / sr)))
         # k normalisation: resonance feedback scales down with alpha so the
         # filter remains unconditionally stable; k→1.0 approaches self-oscillation.
         # Scale by 1.2 for more aggressive resonance character
-        k = float(np.clip(res * 1.2 * (1.0 / (1.0 + alpha)), 0.0, 0.99))
+        k = min(0.99, max(0.0, res * 1.2 * (1.0 / (1.0 + alpha))))
 
         a1 = 1.0 - alpha
 
@@ -1723,6 +2214,11 @@ class SynthEngine:
             out = np.zeros(N, dtype=np.float32)
         s0, s1, s2, s3 = prev_states[0], prev_states[1], prev_states[2], prev_states[3]
 
+        if _dsp_kernels.NUMBA_AVAILABLE:
+            s0, s1, s2, s3 = _dsp_kernels.ladder_kernel(samples, out, alpha, k, s0, s1, s2, s3)
+            out *= 1.3
+            return out, [s0, s1, s2, s3]
+
         for i in range(N):
             x0 = math.tanh(float(samples[i]) - 4.0 * k * s3)
             s0 = a1 * s0 + alpha * x0
@@ -1746,14 +2242,14 @@ class SynthEngine:
         q=2 (no resonance) → q→0 (near self-oscillation); clamped to prevent blow-up.
         """
         sr = self.sample_rate
-        fc = float(np.clip(cutoff, 20.0, sr * 0.45))
-        f_raw = float(np.clip(2.0 * np.sin(np.pi * fc / sr), 0.0, 0.95))
+        fc = min(sr * 0.45, max(20.0, float(cutoff)))
+        f_raw = min(0.95, max(0.0, 2.0 * math.sin(math.pi * fc / sr)))
         # More aggressive Q curve: higher resonance = higher Q (more pronounced peak)
-        q = float(np.clip(0.5 + res * 10.0, 0.5, 10.5))
+        q = min(10.5, max(0.5, 0.5 + res * 10.0))
         # Chamberlin stability condition: f < sqrt(2/q).  Clamp f to 95% of the limit
         # to keep the filter stable at all resonance values without hard cutoff ceiling.
         f_max = math.sqrt(2.0 / q) * 0.95
-        f = float(np.clip(f_raw, 0.0, f_max))
+        f = min(f_max, max(0.0, f_raw))
 
         N = len(samples)
         out = (_out[:N] if _out is not None and len(_out) >= N
@@ -1792,17 +2288,17 @@ class SynthEngine:
           "lp_lp"   → LP output (dual LP — very smooth/dark character)
         """
         sr = self.sample_rate
-        fc = float(np.clip(cutoff, 20.0, sr * 0.45))
-        f_raw = float(np.clip(2.0 * np.sin(np.pi * fc / sr), 0.0, 0.95))
+        fc = min(sr * 0.45, max(20.0, float(cutoff)))
+        f_raw = min(0.95, max(0.0, 2.0 * math.sin(math.pi * fc / sr)))
         # Full Q range for HPF: 0.5 (flat) → 10.0 (harsh resonant peak).
         # Previously capped at 4.0 which made the HP peak feel weak compared to the LP.
         # Matching the LP filter's Q range (0.5-10.5) gives the MS-20 HP+LP routing
         # its characteristic harshness when both peaks are pushed high simultaneously.
-        q = float(np.clip(0.5 + res * 9.5, 0.5, 10.0))
+        q = min(10.0, max(0.5, 0.5 + res * 9.5))
         # Chamberlin stability condition: f < sqrt(2/q).  95% margin keeps filter stable
         # at high resonance + high cutoff combinations without a hard frequency ceiling.
         f_max = math.sqrt(2.0 / q) * 0.95
-        f = float(np.clip(f_raw, 0.0, f_max))
+        f = min(f_max, max(0.0, f_raw))
 
         N = len(samples)
         out = (_out[:N] if _out is not None and len(_out) >= N
@@ -1810,6 +2306,12 @@ class SynthEngine:
         lp = lp_state
         bp = bp_state
 
+        if _dsp_kernels.NUMBA_AVAILABLE:
+            lp, bp = _dsp_kernels.svf_hp_kernel(
+                samples, out, f, q, lp, bp,
+                _dsp_kernels.SVF_ROUTING_CODES.get(routing, _dsp_kernels.SVF_OUT_LP))
+            return out, lp, bp
+
         # Routing is resolved once here so the inner loop contains no string
         # comparisons — each branch is a tight loop over samples only.
         if routing == "lp_hp":
@@ -1872,14 +2374,22 @@ class SynthEngine:
         # the unshifted MIDI pitch (which caused ktrack to have no audible effect
         # when octave != 0, and weak effect when octave == 0 because the reference
         # was fixed at 261.63 regardless of the octave knob position).
-        _oct_mult  = (2.0 ** self.octave) if (self.octave_enabled and self.octave != 0) else 1.0
-        f_sounding = (voice.base_frequency or 261.63) * _oct_mult
-        # C4 reference also shifts with the octave so track_mult stays 1.0 on C4.
-        _ref_freq  = 261.63 * _oct_mult
-        track_mult = 1.0 + self.key_tracking_current * (f_sounding / _ref_freq - 1.0)
-
-        fl_lpf = float(np.clip(self.cutoff_current * cutoff_mod * track_mult, 20.0, 20000.0))
-        fl_hpf = float(np.clip(self.hpf_cutoff_current * track_mult, 20.0, fl_lpf * 0.9))
+        # These inputs only change on a new note, an octave/ktrack knob move, or
+        # while key_tracking is still gliding, so the result is cached per voice.
+        _oct_mult  = self._octave_mult
+        _kt_key = (voice.base_frequency, _oct_mult, self.key_tracking_current)
+        if voice._ktrack_key != _kt_key:
+            f_sounding = (voice.base_frequency or 261.63) * _oct_mult
+            # C4 reference also shifts with the octave so track_mult stays 1.0 on C4.
+            _ref_freq  = 261.63 * _oct_mult
+            voice._ktrack_mult = 1.0 + self.key_tracking_current * (f_sounding / _ref_freq - 1.0)
+            voice._ktrack_key = _kt_key
+        track_mult = voice._ktrack_mult
+
+        # Scalar clamps via min/max: np.clip on a Python float costs ~5 µs of
+        # ufunc dispatch, several times per voice per buffer.
+        fl_lpf = min(max(self.cutoff_current * cutoff_mod * track_mult, 20.0), 20000.0)
+        fl_hpf = min(max(self.hpf_cutoff_current * track_mult, 20.0), fl_lpf * 0.9)
 
         # Per-voice coefficient smoothing: interpolate from previous buffer's value to the
         # new target.  Sudden jumps (FEG restart, key-tracking note change, high EG amount)
@@ -1912,13 +2422,13 @@ class SynthEngine:
         # The asymmetric attack/decay is what gives real varicap circuits their
         # "punch" — the filter darkens on the transient and drifts back slowly.
         if fl_lpf > 0.0:
-            peak_level = float(np.max(np.abs(samples)))
+            peak_level = max(float(samples.max()), -float(samples.min()))
             if peak_level > voice.cap_env:
                 voice.cap_env = peak_level                                      # instant attack
             else:
                 voice.cap_env *= self._CAP_PEAK_DECAY ** len(samples)           # ~300 ms decay
             fl_lpf = fl_lpf * (1.0 - self._CAP_VARICAP_DEPTH * voice.cap_env)
-            fl_lpf = float(np.clip(fl_lpf, 20.0, 20000.0))
+            fl_lpf = min(max(fl_lpf, 20.0), 20000.0)
 
         # ── scipy fast path: biquad IIR (C code, GIL-free, ~100x faster) ───────
         # Replaces the per-sample Python loops for both HPF and LPF stages.
@@ -1955,9 +2465,10 @@ class SynthEngine:
         # Reuses the per-voice svf state slots (previously for LPF-SVF mode).
         hpf_lp_s = voice.filter_state_svf1_lp if rank == 1 else voice.filter_state_svf2_lp
         hpf_bp_s = voice.filter_state_svf1_bp if rank == 1 else voice.filter_state_svf2_bp
+        flt_buf = voice._v_flt_buf if rank == 1 else voice._v_flt_buf_r2
         samples, hpf_lp_s, hpf_bp_s = self._filter_svf_hp_process(
             samples, fl_hpf, hpf_lp_s, hpf_bp_s, self.hpf_resonance_current,
-            routing=self.filter_routing, _out=voice._v_flt_buf)
+            routing=self.filter_routing, _out=flt_buf)
         if rank == 1:
             voice.filter_state_svf1_lp, voice.filter_state_svf1_bp = hpf_lp_s, hpf_bp_s
         else:
@@ -1968,11 +2479,20 @@ class SynthEngine:
         # Thermal noise floor — ~-100 dBFS (amplitude 1e-5), inaudible in isolation
         # but prevents filter dead-zone lock when self-oscillating at max resonance,
         # and adds a subtle analog "air" that's felt rather than heard in the mix.
-        samples = samples + np.random.randn(len(samples)).astype(np.float32) * 1e-5
+        # samples is this voice's SVF output scratch here, so the noise is added
+        # in place from the engine's own generator.
+        _n = len(samples)
+        if _n <= len(self._cb_thermal):
+            _noise = self._thermal_rng.standard_normal(
+                _n, dtype=np.float32, out=self._cb_thermal[:_n])
+            _noise *= np.float32(1e-5)
+            samples += _noise
+        else:
+            samples = samples + np.random.randn(_n).astype(np.float32) * 1e-5
 
         ladder_s = voice.filter_state_ladder1 if rank == 1 else voice.filter_state_ladder2
         filtered, ladder_s = self._filter_ladder_process(
-            samples, fl_lpf, ladder_s, voice.smooth_resonance, _out=voice._v_flt_buf)
+            samples, fl_lpf, ladder_s, voice.smooth_resonance, _out=flt_buf)
         if rank == 1: voice.filter_state_ladder1 = ladder_s
         else:         voice.filter_state_ladder2 = ladder_s
 
@@ -1987,10 +2507,10 @@ class SynthEngine:
         t = voice.feg_time
         if voice.feg_is_releasing:
             t_rel = max(0.0, t - voice.feg_release_start)
-            return float(np.clip(voice.feg_release_level * np.exp(-t_rel / max(0.001, self.feg_release)), 0.0, 1.0))
+            return min(1.0, max(0.0, voice.feg_release_level * math.exp(-t_rel / max(0.001, self.feg_release))))
         atk = max(0.001, self.feg_attack)
         dcy = max(0.001, self.feg_decay)
-        sus = float(np.clip(self.feg_sustain, 0.0, 1.0))
+        sus = min(1.0, max(0.0, self.feg_sustain))
         if t < atk:
             return float(t / atk)
         elif t < atk + dcy:
@@ -2018,14 +2538,14 @@ class SynthEngine:
             # a sudden large cutoff step that high-resonance filters amplify into a spike.
             t_rel = max(0.0, t - voice.feg_release_start)
             time_const = max(0.001, self.feg_release)
-            level = voice.feg_release_level * np.exp(-t_rel / time_const)
+            level = voice.feg_release_level * math.exp(-t_rel / time_const)
             voice.feg_time += dt
-            return float(np.clip(level, 0.0, 1.0))
+            return min(1.0, max(0.0, level))
         else:
             # Attack → Decay → Sustain
             atk = max(0.001, self.feg_attack)
             dcy = max(0.001, self.feg_decay)
-            sus = float(np.clip(self.feg_sustain, 0.0, 1.0))
+            sus = min(1.0, max(0.0, self.feg_sustain))
             if t < atk:
                 level = t / atk
             elif t < atk + dcy:
@@ -2034,7 +2554,7 @@ class SynthEngine:
             else:
                 level = sus
             voice.feg_time += dt
-            return float(np.clip(level, 0.0, 1.0))
+            return min(1.0, max(0.0, level))
 
     def _apply_dc_blocker(self, voice: Voice, samples: np.ndarray) -> np.ndarray:
         """First-order HPF DC blocker with frequency-adaptive pole.
@@ -2055,41 +2575,120 @@ class SynthEngine:
           f0 = 50 Hz  : 0.9997  (pole 0.7 Hz)
           f0 < 50 Hz  : 0.9997  (clamped — already very low pole)
         """
-        f0 = voice.frequency or 440.0
-        if f0 >= 100.0:
-            coeff = 0.9990
-        elif f0 >= 50.0:
-            # Linear interpolation: t=0 at 50 Hz → coeff=0.9997; t=1 at 100 Hz → coeff=0.9990
-            t = (f0 - 50.0) / 50.0
-            coeff = 0.9997 - t * 0.0007
-        else:
-            coeff = 0.9997
+        coeff = self._dc_blocker_coeff(voice)
+
+        # numba path: the same transposed-form update as lfilter, compiled, so
+        # the state in _arm_dcblock_zi carries over between the two paths.
+        if _dsp_kernels.NUMBA_AVAILABLE:
+            zi = voice._arm_dcblock_zi
+            if zi is None:
+                zi = voice._arm_dcblock_zi = np.array(
+                    [-voice.dc_blocker_x + coeff * voice.dc_blocker_y])
+            out = voice._v_dc_buf[:len(samples)]
+            zi[0], voice.dc_blocker_x, voice.dc_blocker_y = _dsp_kernels.dc_blocker_kernel(
+                samples, out, coeff, zi[0])
+            return out
 
         # scipy fast path: lfilter (C code, GIL-free).
         # DC blocker H(z) = (1 - z^-1)/(1 - coeff*z^-1); b=[1,-1], a=[1,-coeff].
         # Transposed DF-II initial state: zi[0] = -x_prev + coeff * y_prev.
         if self._scipy_lfilter is not None:
-            b_dc = np.array([1.0, -1.0])
-            a_dc = np.array([1.0, -coeff])
+            a_dc = voice._dc_a
+            a_dc[1] = -coeff
             if voice._arm_dcblock_zi is None:
                 voice._arm_dcblock_zi = np.array([-voice.dc_blocker_x + coeff * voice.dc_blocker_y])
-            filtered, zf = self._scipy_lfilter(b_dc, a_dc, samples.astype(np.float64),
+            # lfilter promotes the float32 input to the float64 coefficients'
+            # type itself, so no explicit upcast copy is needed going in; the
+            # result lands in the voice's pre-allocated float32 buffer.
+            filtered, zf = self._scipy_lfilter(_DC_B, a_dc, samples,
                                                zi=voice._arm_dcblock_zi)
             voice._arm_dcblock_zi = zf
             voice.dc_blocker_x = float(samples[-1])
             voice.dc_blocker_y = float(filtered[-1])
-            return filtered.astype(np.float32)
+            out = voice._v_dc_buf[:len(samples)]
+            np.copyto(out, filtered, casting='same_kind')
+            return out
 
         xp, yp = voice.dc_blocker_x, voice.dc_blocker_y
         n = len(samples)
         # All Voice instances have _v_dc_buf pre-allocated in __init__ — no hasattr needed.
         filtered = voice._v_dc_buf[:n]
+        # x is read before filtered[i] is written, so samples may alias filtered.
         for i in range(n):
-            filtered[i] = samples[i] - xp + coeff * yp
-            xp, yp = samples[i], filtered[i]
+            x = samples[i]
+            filtered[i] = x - xp + coeff * yp
+            xp, yp = x, filtered[i]
         voice.dc_blocker_x, voice.dc_blocker_y = xp, yp
         return filtered
 
+    def _apply_dc_blocker_voices(self, voices: list, num_samples: int) -> None:
+        """DC-block several voices' output rows of _voice_out_mat in place.
+
+        Voices whose notes sit at or above 100 Hz all share the same pole, so
+        each distinct coefficient is filtered with a single 2-D lfilter call
+        (one row per voice, per-row zi) instead of one call per voice.  Same
+        filter and state handling as _apply_dc_blocker; voices is a list of
+        (slot, voice).  With numba every row, whatever its pole, is filtered
+        by one kernel call; without scipy each row runs the per-voice loop.
+        """
+        mat = self._voice_out_mat
+        if _dsp_kernels.NUMBA_AVAILABLE:
+            rows, coeffs, state = self._cb_dc_rows, self._cb_dc_coeff, self._cb_dc_state
+            for k, (vi, v) in enumerate(voices):
+                coeff = self._dc_blocker_coeff(v)
+                if v._arm_dcblock_zi is None:
+                    v._arm_dcblock_zi = np.array([-v.dc_blocker_x + coeff * v.dc_blocker_y])
+                rows[k] = vi
+                coeffs[k] = coeff
+                state[k, 0] = v._arm_dcblock_zi[0]
+            _n = len(voices)
+            _dsp_kernels.dc_blocker_rows_kernel(mat, rows[:_n], coeffs[:_n],
+                                                state[:_n], num_samples)
+            for k, (vi, v) in enumerate(voices):
+                v._arm_dcblock_zi[0] = state[k, 0]
+                v.dc_blocker_x = float(state[k, 1])
+                v.dc_blocker_y = float(state[k, 2])
+            return
+        if self._scipy_lfilter is None:
+            for vi, v in voices:
+                self._apply_dc_blocker(v, mat[vi, :num_samples])
+            return
+
+        groups: dict = {}
+        for vi, v in voices:
+            groups.setdefault(self._dc_blocker_coeff(v), []).append((vi, v))
+        for coeff, members in groups.items():
+            if len(members) == 1:
+                vi, v = members[0]
+                self._apply_dc_blocker(v, mat[vi, :num_samples])
+                continue
+            rows = [vi for vi, _v in members]
+            x = mat[rows, :num_samples]
+            zi = np.empty((len(members), 1))
+            for r, (_vi, v) in enumerate(members):
+                zi[r, 0] = (v._arm_dcblock_zi[0] if v._arm_dcblock_zi is not None
+                            else -v.dc_blocker_x + coeff * v.dc_blocker_y)
+            a_dc = members[0][1]._dc_a
+            a_dc[1] = -coeff
+            y, zf = self._scipy_lfilter(_DC_B, a_dc, x, axis=-1, zi=zi)
+            mat[rows, :num_samples] = y
+            for r, (_vi, v) in enumerate(members):
+                v._arm_dcblock_zi = zf[r]
+                v.dc_blocker_x = float(x[r, -1])
+                v.dc_blocker_y = float(y[r, -1])
+
+    @staticmethod
+    def _dc_blocker_coeff(voice: Voice) -> float:
+        """DC blocker pole for this voice's pitch (see _apply_dc_blocker)."""
+        f0 = voice.frequency or 440.0
+        if f0 >= 100.0:
+            return 0.9990
+        if f0 >= 50.0:
+            # Linear interpolation: t=0 at 50 Hz → coeff=0.9997; t=1 at 100 Hz → coeff=0.9990
+            t = (f0 - 50.0) / 50.0
+            return 0.9997 - t * 0.0007
+        return 0.9997
+
     def _sanitize_signal(self, samples: np.ndarray) -> np.ndarray:
         """Replace NaN/Inf with zeros and hard-clip to ±2.0 in-place.
 
@@ -2100,8 +2699,11 @@ class SynthEngine:
         are unaffected; only pathological values are clipped.
         In-place operations avoid allocation overhead on each per-voice call.
         """
-        # Replace non-finite values (NaN/Inf/-Inf) with 0 in-place.
-        np.nan_to_num(samples, copy=False, nan=0.0, posinf=0.0, neginf=0.0)
+        # Replace non-finite values (NaN/Inf/-Inf) with 0 in-place.  A NaN or
+        # Inf anywhere makes the dot product non-finite, so the allocating
+        # nan_to_num pass only runs when there is something to replace.
+        if not math.isfinite(float(np.dot(samples, samples))):
+            np.nan_to_num(samples, copy=False, nan=0.0, posinf=0.0, neginf=0.0)
         np.clip(samples, -2.0, 2.0, out=samples)
         return samples
 
@@ -2112,6 +2714,7 @@ class SynthEngine:
         - 'param_update'  : ALL drained immediately — parameters must apply
                             in the next buffer without delay, and they carry no
                             click risk because they go through smoothing ramps.
+                            Merged per key (last write wins) and applied once.
         - 'all_notes_off' : ALL drained immediately — silence must be instant.
         - 'note_on' / 'note_off' : capped at 3 per buffer to spread rapid
                             polyphony changes across consecutive buffers, giving
@@ -2123,57 +2726,17 @@ class SynthEngine:
         # These are applied on the audio thread so there is no race with the
         # DSP code that follows in the same callback invocation.
         pending_notes = []
-        while True:
-            try:
-                e = self.midi_event_queue.get_nowait()
-            except Exception:
-                break
+        # Bulk drain: every event queued so far in one call, no lock taken
+        # (see EventQueue).  Events put while draining wait for the next buffer.
+        events = self.midi_event_queue.drain()
+        if not events:
+            return
+        # Parameter writes are coalesced: a slider drag can queue dozens of
+        # updates to the same key per buffer, and only the last value matters.
+        params = {}
+        for e in events:
             if e['type'] == 'param_update':
-                # Apply parameter writes on the audio thread — eliminates the
-                # UI-thread vs audio-thread race on all 25+ shared attributes.
-                for k, v in e['params'].items():
-                    if hasattr(self, k):
-                        if k == 'amp_level':         self.amp_level_target       = v
-                        elif k == 'master_volume':   self.master_volume_target   = v
-                        elif k == 'cutoff':          self.cutoff_target          = v
-                        elif k == 'hpf_cutoff':      self.hpf_cutoff_target      = v
-                        elif k == 'resonance':       self.resonance_target       = v
-                        elif k == 'hpf_resonance':   self.hpf_resonance_target   = v
-                        elif k == 'noise_level':     self.noise_level_target     = v
-                        elif k == 'key_tracking':    self.key_tracking_target    = v
-                        elif k == 'filter_drive':    self.filter_drive_target    = float(v)
-                        elif k == 'filter_routing':  self.filter_routing         = v
-                        elif k == 'feg_attack':      self.feg_attack  = float(v)
-                        elif k == 'feg_decay':       self.feg_decay   = float(v)
-                        elif k == 'feg_sustain':     self.feg_sustain = float(v)
-                        elif k == 'feg_release':     self.feg_release = float(v)
-                        elif k == 'feg_amount':      self.feg_amount  = float(v)
-                        elif k == 'voice_type':      self.voice_type             = v
-                        elif k == 'filter_mode':     pass  # kept for preset backward-compat; ignored
-                        else:
-                            setattr(self, k, v)
-                            if k == 'delay_time':
-                                # Recalculate integer sample count when delay time changes.
-                                self.delay_time    = float(v)
-                                self._delay_samples = max(1, min(
-                                    int(v * self.sample_rate),
-                                    len(self._delay_buf_l) - 1))
-                            elif k == 'arp_bpm':
-                                self.arp_bpm = float(v); self._arp_recalc_timing()
-                            elif k == 'arp_gate':
-                                self.arp_gate = float(v); self._arp_recalc_timing()
-                            elif k == 'arp_range':
-                                self.arp_range = int(v); self._arp_rebuild_sequence()
-                            elif k == 'arp_enabled':
-                                self.arp_enabled = bool(v)
-                                if not self.arp_enabled:
-                                    if self._arp_note_playing is not None:
-                                        self._release_note(self._arp_note_playing)
-                                        self._arp_note_playing = None
-                                self._arp_sample_counter = 0
-                            elif k == 'arp_mode':
-                                self.arp_mode = v
-                                self._arp_index = 0; self._arp_direction = 1
+                params.update(e['params'])
             elif e['type'] == 'all_notes_off':
                 # Reset voices on the audio thread — safe between DSP buffers.
                 for v in self.voices:
@@ -2185,6 +2748,7 @@ class SynthEngine:
                 self._arp_note_playing = None; self._arp_sample_counter = 0
                 # Reset MONO dissolve state so next note starts clean on slot 0.
                 self._mono_primary = 0; self.mono_voice_index = 0
+                self._note_to_voice.clear(); self._note_map_dups = False
                 # Stop FX tail drain immediately — panic/all_notes_off means silence NOW.
                 self._fx_tail_samples = 0
                 self._pending_all_notes_off = False  # cancel any pending soft silence
@@ -2224,23 +2788,26 @@ class SynthEngine:
             else:
                 # note_on / note_off — collect and process below with the cap.
                 pending_notes.append(e)
+        if params:
+            self._apply_param_updates(params)
 
         # Second pass: process note events with the 3-per-buffer cap.
         # When arp is enabled, note_on/note_off update the held-note list and
         # rebuild the arp sequence rather than triggering voices directly.
         # drum_trigger events bypass the cap and are always processed immediately
         # so that all drums on a sequencer step fire in the same buffer.
+        deferred = []
         for e in pending_notes:
             if e['type'] == 'drum_trigger':
                 # Atomic drum trigger: apply this drum's params then immediately
                 # trigger its note. No cap — up to 8 drums can fire per buffer.
                 self._apply_drum_params_inline(e['params'])
-                self._trigger_note(e['note'], e['velocity'] / 127.0)
+                self._trigger_note(e['note'], _vel_norm(e['velocity']))
                 note_events_processed += 1
                 continue
             if note_events_processed >= 3:
-                # Re-enqueue remaining note events for the next buffer.
-                self.midi_event_queue.put(e)
+                # Over the cap: hold for the next buffer (requeued below).
+                deferred.append(e)
             else:
                 if e['type'] == 'note_on':
                     # Capture into looper if recording or overdubbing.
@@ -2270,6 +2837,57 @@ class SynthEngine:
                     else:
                         self._release_note(e['note'], e.get('velocity', 0.5))
                     note_events_processed += 1
+        if deferred:
+            # Back at the head of the queue, in order: a plain put would land
+            # them behind events that arrived during this buffer, so a deferred
+            # note_off could be applied after a newer note_on for the same key.
+            self.midi_event_queue.requeue(deferred)
+
+    def _apply_param_updates(self, params: dict):
+        """Apply a buffer's coalesced param_update writes on the audio thread.
+
+        Running them here eliminates the UI-thread vs audio-thread race on all
+        25+ shared attributes.  Keys the engine does not have are ignored.
+        """
+        redirects = self._PARAM_REDIRECTS
+        for k, v in params.items():
+            if not hasattr(self, k):
+                continue
+            redirect = redirects.get(k)
+            if redirect is not None:
+                attr, conv = redirect
+                setattr(self, attr, v if conv is None else conv(v))
+            elif k == 'voice_type':
+                self.voice_type = v
+                self._rebuild_note_map()
+            elif k == 'filter_mode':
+                pass  # kept for preset backward-compat; ignored
+            else:
+                setattr(self, k, v)
+                if k in ('waveform', 'octave', 'octave_enabled'):
+                    self._refresh_master_consts()
+                if k == 'delay_time':
+                    # Recalculate integer sample count when delay time changes.
+                    self.delay_time    = float(v)
+                    self._delay_samples = max(1, min(
+                        int(v * self.sample_rate),
+                        len(self._delay_buf_l) - 1))
+                elif k == 'arp_bpm':
+                    self.arp_bpm = float(v); self._arp_recalc_timing()
+                elif k == 'arp_gate':
+                    self.arp_gate = float(v); self._arp_recalc_timing()
+                elif k == 'arp_range':
+                    self.arp_range = int(v); self._arp_rebuild_sequence()
+                elif k == 'arp_enabled':
+                    self.arp_enabled = bool(v)
+                    if not self.arp_enabled:
+                        if self._arp_note_playing is not None:
+                            self._release_note(self._arp_note_playing)
+                            self._arp_note_playing = None
+                    self._arp_sample_counter = 0
+                elif k == 'arp_mode':
+                    self.arp_mode = v
+                    self._arp_index = 0; self._arp_direction = 1
 
     def _apply_drum_params_inline(self, params: dict):
         """Apply drum synthesis parameters directly on the audio thread (no smoothing queue).
@@ -2297,6 +2915,20 @@ class SynthEngine:
                 pass  # LPF always uses ladder; filter_mode kept for preset compat only
             elif hasattr(self, k):
                 setattr(self, k, v)
+                if k in ('waveform', 'octave', 'octave_enabled'):
+                    self._refresh_master_consts()
+
+    def _refresh_master_consts(self):
+        """Cache the waveform saturation ceiling, octave loudness boost and
+        octave pitch multiplier.
+
+        All depend only on parameters that change at UI rate, so they are
+        resolved here when waveform, octave or octave_enabled is written
+        rather than recomputed in the audio callback on every buffer.
+        """
+        self._wave_ceiling = max(self._WAVE_CEILING.get(self.waveform, 1.0), 0.01)
+        self._octave_comp = self._OCTAVE_COMP.get(self.octave, 1.0)
+        self._octave_mult = (2.0 ** self.octave) if (self.octave_enabled and self.octave != 0) else 1.0
 
     def _trigger_note(self, note: int, vel: float):
         # MONO and UNISON use gate behavior: velocity is ignored, amplitude is always full.
@@ -2528,16 +3160,23 @@ class SynthEngine:
 
         else:  # "poly" mode (default)
             # Retrigger if already playing
-            for v in self.voices:
-                if v.midi_note == note and v.note_active:
-                    v.trigger(note, freq, vel)
-                    v.onset_ms = onset_ms_for_note
-                    return
-            # Find available voice
+            v = self._note_to_voice.get(note)
+            if v is not None and v.midi_note == note and v.note_active:
+                v.trigger(note, freq, vel)
+                v.onset_ms = onset_ms_for_note
+                return
+            # Find available voice.  Deliberately a lowest-index-first scan rather
+            # than a free-voice deque: each slot has a fixed stereo pan position,
+            # so a FIFO free list would rotate where repeated chords sit in the
+            # field, and availability flips inside the envelope code and reset()
+            # with no single place to push a voice back.  At 6-8 voices this loop
+            # is two attribute reads per slot; retrigger and release already go
+            # through _note_to_voice.
             for v in self.voices:
                 if v.is_available():
                     v.trigger(note, freq, vel)
                     v.onset_ms = onset_ms_for_note
+                    self._note_to_voice[note] = v
                     return
             # Voice stealing — three-tier strategy:
             #
@@ -2566,20 +3205,23 @@ class SynthEngine:
             # monitors each voice's envelope CV and flags the lowest as available.
             # Stealing a nearly-silent voice causes no audible click; stealing a
             # loud active voice causes the artifact the user heard.
+            #
+            # A plain max() over the voice objects: stealing only runs when every
+            # slot is busy, over 6-8 voices, so packing the state into arrays for
+            # an argmax would cost more in upkeep on every note than it saves here.
+            held = self.held_notes
+
             def _steal_priority(v):
-                quietest = -v.last_envelope_level   # lower amplitude → higher score
-                if v.is_releasing and v.midi_note not in self.held_notes:
-                    return (3, v.envelope_time) if v.last_envelope_level < 0.05 else (2, v.envelope_time)
-                if v.is_releasing:
-                    return (1, quietest)
-                return (0, quietest)
+                if not v.is_releasing:
+                    return (0, -v.last_envelope_level)   # lower amplitude → higher score
+                if v.midi_note in held:
+                    return (1, -v.last_envelope_level)
+                return (3 if v.last_envelope_level < 0.05 else 2, v.envelope_time)
 
             best_v = max(self.voices, key=_steal_priority)
 
             # Tier 1: tail is inaudible — steal directly (original fast path).
-            steal_is_safe = (best_v.is_releasing
-                             and best_v.midi_note not in self.held_notes
-                             and best_v.last_envelope_level < 0.05)
+            steal_is_safe = _steal_priority(best_v)[0] == 3
 
             if not steal_is_safe:
                 # Tier 2: try to promote the stolen voice to a ghost slot so its
@@ -2597,7 +3239,7 @@ class SynthEngine:
                     ghost_slot.sine_phase         = best_v.sine_phase
                     ghost_slot.note_active        = best_v.note_active
                     ghost_slot.is_releasing       = best_v.is_releasing
-                    ghost_slot.envelope_time      = best_v.envelope_time
+                    ghost_slot.envelope_samples   = best_v.envelope_samples
                     ghost_slot.release_start_level = best_v.release_start_level
                     ghost_slot.last_envelope_level = best_v.last_envelope_level
                     ghost_slot.velocity           = best_v.velocity
@@ -2644,6 +3286,23 @@ class SynthEngine:
             # double-damped attack (audible stutter gap). Only one mechanism should
             # handle the transition; steal_start_level (8ms CROSS crossfade) does it.
             best_v.onset_samples = int(self.sample_rate * onset_ms_for_note / 1000.0) + 1
+            self._note_to_voice[note] = best_v
+
+    def _rebuild_note_map(self):
+        """Rebuild the POLY note -> voice map from the current voice states.
+
+        Called when voice_type changes, since MONO and UNISON assign notes
+        without touching the map.  The first active voice per note wins, which
+        matches the order the retrigger scan used to follow.
+        """
+        self._note_to_voice.clear()
+        self._note_map_dups = False
+        for v in self.voices:
+            if v.note_active and v.midi_note is not None:
+                if v.midi_note in self._note_to_voice:
+                    self._note_map_dups = True
+                else:
+                    self._note_to_voice[v.midi_note] = v
 
     def _release_note(self, note: int, velocity: float = 0.5):
         if self.voice_type == "mono":
@@ -2676,13 +3335,33 @@ class SynthEngine:
                         v.feg_is_releasing = True
                         v.feg_release_start = v.feg_time
         else:
-            for v in self.voices:
+            v = self._note_to_voice.pop(note, None)
+            if self._note_map_dups or v is None or v.midi_note != note:
+                targets = self.voices
+            else:
+                targets = (v,)
+            for v in targets:
                 if v.midi_note == note and v.note_active:
                     v.release(self.attack, self.decay, self.sustain, 1.0, velocity)
                     v.feg_release_level = self._feg_level_snapshot(v)
                     v.feg_is_releasing = True
                     v.feg_release_start = v.feg_time
 
+    def _master_chain_settled(self) -> bool:
+        """True when the post-mix stages hold no state that silence would still
+        change audibly: master gain and compressor back at unity, subsonic
+        high-pass and output transformer memories decayed, and no fade or
+        crossfade in progress."""
+        return (self.master_gain_current > 0.999
+                and self._comp_gain > 0.999 and self._comp_env < 1e-3
+                and abs(self._sub_hp_y_l) < 1e-6 and abs(self._sub_hp_y_r) < 1e-6
+                and abs(self._sub_hp_x_l) < 1e-6 and abs(self._sub_hp_x_r) < 1e-6
+                and abs(self._XFMR_LP_ZI_L[0]) < 1e-6 and abs(self._XFMR_LP_ZI_R[0]) < 1e-6
+                and self._transition_xf_remaining == 0
+                and self._filter_ramp_remaining == 0
+                and self._mute_ramp_remaining == 0
+                and self._mute_ramp_fadein == 0)
+
     def _audio_callback(self, outdata, frame_count, time, status):
         try:
             # Count driver-level underruns/overruns without printing. print()
@@ -2700,6 +3379,14 @@ class SynthEngine:
                     _arm_probe = True
                     _cb_t0 = self._perf_counter()
 
+            # Scheduling priority is per thread, so it has to be raised from the
+            # PortAudio callback thread itself.  Done on the first buffer, which
+            # falls inside the startup silence, so the one-off ctypes setup
+            # cannot cost an audible glitch.
+            if not self._callback_priority_set:
+                self._callback_priority_set = True
+                self._elevate_audio_priority()
+
             # Output initial silence for ~50ms after startup to avoid filter transients
             if self._startup_silence_samples > 0:
                 outdata.fill(0)
@@ -2707,59 +3394,75 @@ class SynthEngine:
                 return
 
             self._process_midi_events()
-            self._update_voice_frequencies()
-            if abs(self.amp_level_current - self.amp_level_target) > 0.0001:
-                self.amp_level_current = self.amp_level_current * self.amp_smoothing + self.amp_level_target * (1.0 - self.amp_smoothing)
-            else: self.amp_level_current = self.amp_level_target
-            if abs(self.master_volume - self.master_volume_target) > 0.001:
-                self.master_volume = self.master_volume * 0.9 + self.master_volume_target * 0.1
-            else: self.master_volume = self.master_volume_target
+            # Pitch bend at rest with the wheel centred leaves every voice at its
+            # base frequency, so the update (and the method call) is skipped.
+            if self.pitch_bend != self.pitch_bend_target or self._pb_mult != 1.0:
+                self._update_voice_frequencies()
+            # One-pole smoothers that snap to target once within epsilon.  At rest
+            # (the usual case) each costs one equality test; the snap is kept
+            # rather than running the one-pole unconditionally, since that only
+            # approaches the target asymptotically and values derived from the
+            # current setting would keep changing by rounding noise.
+            if self.amp_level_current != self.amp_level_target:
+                if abs(self.amp_level_current - self.amp_level_target) > 0.0001:
+                    self.amp_level_current = self.amp_level_current * self.amp_smoothing + self.amp_level_target * (1.0 - self.amp_smoothing)
+                else: self.amp_level_current = self.amp_level_target
+            if self.master_volume != self.master_volume_target:
+                if abs(self.master_volume - self.master_volume_target) > 0.001:
+                    self.master_volume = self.master_volume * 0.9 + self.master_volume_target * 0.1
+                else: self.master_volume = self.master_volume_target
 
             # --- Per-buffer parameter smoothing: cutoff, resonance, intensity ---
             # Eliminates clicks from hard parameter step-changes mid-playback.
-            if abs(self.cutoff_current - self.cutoff_target) > 0.5:
-                self.cutoff_current = (self.cutoff_current * self.cutoff_smoothing
-                                       + self.cutoff_target * (1.0 - self.cutoff_smoothing))
-            else:
-                self.cutoff_current = self.cutoff_target
-            if abs(self.resonance_current - self.resonance_target) > 0.001:
-                self.resonance_current = (self.resonance_current * self.resonance_smoothing
-                                          + self.resonance_target * (1.0 - self.resonance_smoothing))
-            else:
-                self.resonance_current = self.resonance_target
-            if abs(self.noise_level_current - self.noise_level_target) > 0.001:
-                self.noise_level_current = (self.noise_level_current * self.noise_level_smoothing
-                                            + self.noise_level_target * (1.0 - self.noise_level_smoothing))
-            else:
-                self.noise_level_current = self.noise_level_target
-            if abs(self.key_tracking_current - self.key_tracking_target) > 0.001:
-                self.key_tracking_current = (self.key_tracking_current * self.key_tracking_smoothing
-                                             + self.key_tracking_target * (1.0 - self.key_tracking_smoothing))
-            else:
-                self.key_tracking_current = self.key_tracking_target
-            if abs(self.hpf_cutoff_current - self.hpf_cutoff_target) > 0.5:
-                self.hpf_cutoff_current = (self.hpf_cutoff_current * self.hpf_cutoff_smoothing
-                                           + self.hpf_cutoff_target * (1.0 - self.hpf_cutoff_smoothing))
-            else:
-                self.hpf_cutoff_current = self.hpf_cutoff_target
-            if abs(self.hpf_resonance_current - self.hpf_resonance_target) > 0.001:
-                self.hpf_resonance_current = (self.hpf_resonance_current * self.hpf_resonance_smoothing
-                                              + self.hpf_resonance_target * (1.0 - self.hpf_resonance_smoothing))
-            else:
-                self.hpf_resonance_current = self.hpf_resonance_target
+            if self.cutoff_current != self.cutoff_target:
+                if abs(self.cutoff_current - self.cutoff_target) > 0.5:
+                    self.cutoff_current = (self.cutoff_current * self.cutoff_smoothing
+                                           + self.cutoff_target * (1.0 - self.cutoff_smoothing))
+                else:
+                    self.cutoff_current = self.cutoff_target
+            if self.resonance_current != self.resonance_target:
+                if abs(self.resonance_current - self.resonance_target) > 0.001:
+                    self.resonance_current = (self.resonance_current * self.resonance_smoothing
+                                              + self.resonance_target * (1.0 - self.resonance_smoothing))
+                else:
+                    self.resonance_current = self.resonance_target
+            if self.noise_level_current != self.noise_level_target:
+                if abs(self.noise_level_current - self.noise_level_target) > 0.001:
+                    self.noise_level_current = (self.noise_level_current * self.noise_level_smoothing
+                                                + self.noise_level_target * (1.0 - self.noise_level_smoothing))
+                else:
+                    self.noise_level_current = self.noise_level_target
+            if self.key_tracking_current != self.key_tracking_target:
+                if abs(self.key_tracking_current - self.key_tracking_target) > 0.001:
+                    self.key_tracking_current = (self.key_tracking_current * self.key_tracking_smoothing
+                                                 + self.key_tracking_target * (1.0 - self.key_tracking_smoothing))
+                else:
+                    self.key_tracking_current = self.key_tracking_target
+            if self.hpf_cutoff_current != self.hpf_cutoff_target:
+                if abs(self.hpf_cutoff_current - self.hpf_cutoff_target) > 0.5:
+                    self.hpf_cutoff_current = (self.hpf_cutoff_current * self.hpf_cutoff_smoothing
+                                               + self.hpf_cutoff_target * (1.0 - self.hpf_cutoff_smoothing))
+                else:
+                    self.hpf_cutoff_current = self.hpf_cutoff_target
+            if self.hpf_resonance_current != self.hpf_resonance_target:
+                if abs(self.hpf_resonance_current - self.hpf_resonance_target) > 0.001:
+                    self.hpf_resonance_current = (self.hpf_resonance_current * self.hpf_resonance_smoothing
+                                                  + self.hpf_resonance_target * (1.0 - self.hpf_resonance_smoothing))
+                else:
+                    self.hpf_resonance_current = self.hpf_resonance_target
             # Drive is a character knob — no smoothing needed.  Instant update
             # means the user hears the effect the moment they change the value.
             self.filter_drive_current = self.filter_drive_target
 
             # ── LFO (shape-aware, single depth + target routing) ────────────
             lfo_phase_prev = self.lfo_phase
-            lfo_phase_inc  = 2.0 * np.pi * self.lfo_freq * frame_count / self.sample_rate
-            self.lfo_phase = (self.lfo_phase + lfo_phase_inc) % (2.0 * np.pi)
+            lfo_phase_inc  = self.lfo_freq * frame_count * self._two_pi_over_sr
+            self.lfo_phase = (self.lfo_phase + lfo_phase_inc) % _TWO_PI
             if self.lfo_shape == "triangle":
-                t_norm = lfo_phase_prev / (2.0 * np.pi)
+                t_norm = lfo_phase_prev * _INV_TWO_PI
                 lfo_val = float(4.0 * abs(t_norm - 0.5) - 1.0)
             elif self.lfo_shape == "square":
-                lfo_val = 1.0 if lfo_phase_prev < np.pi else -1.0
+                lfo_val = 1.0 if lfo_phase_prev < math.pi else -1.0
             elif self.lfo_shape == "sample_hold":
                 # Phase wrap signals a new S&H period — sample a new random value.
                 # Safe check: if prev > current the modulo wrapped (lfo_freq is
@@ -2768,7 +3471,7 @@ class SynthEngine:
                     self._lfo_sh_value = _rnd.uniform(-1.0, 1.0)
                 lfo_val = self._lfo_sh_value
             else:  # "sine" (default)
-                lfo_val = float(np.sin(lfo_phase_prev))
+                lfo_val = math.sin(lfo_phase_prev)
             # Route lfo_depth to the correct destination(s); legacy per-dest mods
             # (lfo_vco_mod / lfo_vcf_mod / lfo_vca_mod) are retained for backward
             # compat with old presets — new UI only writes lfo_depth + lfo_target.
@@ -2786,11 +3489,11 @@ class SynthEngine:
             vcf_lfo = 1.0 + lfo_val * (vcf_mod + self.lfo_vcf_mod) * 0.5
             vca_lfo = 1.0 + lfo_val * (vca_mod + self.lfo_vca_mod) * 0.3
 
-            # Use pre-allocated buffers — fill with zeros in-place (no malloc)
+            # Pre-allocated L/R buses (no malloc).  They are not zeroed here: the
+            # voice mix below overwrites them, and clears them itself when no
+            # voice was rendered this buffer.
             mixed_l = self._cb_mixed_l[:frame_count]
             mixed_r = self._cb_mixed_r[:frame_count]
-            mixed_l.fill(0.0)
-            mixed_r.fill(0.0)
 
             # ── Arpeggiator clock (audio-thread driven, sample-accurate) ────
             # The counter advances by frame_count each buffer; when it reaches
@@ -2865,7 +3568,15 @@ class SynthEngine:
             # transition in this buffer rather than lagging one buffer behind.
             # Ghost voices are intentionally excluded: they drain release tails but
             # must not inflate the gain denominator (they already output at 0.7×).
-            active_count = sum(1 for v in self.voices if v.note_active or v.is_releasing)
+            # playing_count (held voices only) feeds the POLY gain below; both
+            # counts come from one pass over the voices.
+            active_count = playing_count = 0
+            for v in self.voices:
+                if v.note_active:
+                    playing_count += 1
+                    active_count += 1
+                elif v.is_releasing:
+                    active_count += 1
 
             # Arm crossfade when voices just went silent this buffer.
             # Without this, the last non-zero sample of a release sits in
@@ -2898,7 +3609,15 @@ class SynthEngine:
                 # _fx_tail_samples is set to a generous ceiling whenever a voice is
                 # triggered (in _trigger_note) and decremented here while draining so
                 # the callback returns to silence naturally once the tail expires.
-                if self._fx_tail_samples <= 0 and self._metro_click_buf is None:
+                # With both FX bypassed there is no tail to drain: once the master
+                # chain has settled (gain recovered, filters and ramps at
+                # rest) its output on zeros is just dither, so silence is returned
+                # instead of running the whole chain for the rest of the 10 s window.
+                _fx_tail_live = ((self.ENABLE_DELAY and self.delay_mix > 0.0)
+                                 or (self.ENABLE_CHORUS and self.chorus_mix > 0.0))
+                if ((self._fx_tail_samples <= 0
+                        or (not _fx_tail_live and self._master_chain_settled()))
+                        and self._metro_click_buf is None):
                     outdata.fill(0)
                     return
                 self._fx_tail_samples = max(0, self._fx_tail_samples - frame_count)
@@ -2921,9 +3640,8 @@ class SynthEngine:
             # producing a visible and audible volume bump on each note.
             # Releasing voices are already decaying naturally via their envelope; they
             # don't need additional gain compensation.
-            playing_count = sum(1 for v in self.voices if v.note_active)
             gain_count = 1 if self.voice_type in ("mono", "unison") else max(playing_count, 1)
-            self.master_gain_target = 1.0 / np.sqrt(gain_count) if gain_count > 1 else 1.0
+            self.master_gain_target = 1.0 / math.sqrt(gain_count) if gain_count > 1 else 1.0
             # Snapshot gain AFTER the target is known but BEFORE smoothing,
             # so gain_ramp interpolates from the previous buffer's settled value
             # to the new smoothed value — a true per-sample continuous transition.
@@ -2946,281 +3664,329 @@ class SynthEngine:
             np.multiply(self._cb_indices[:frame_count], _gr_step, out=gain_ramp)
             gain_ramp += gain_prev
 
+            # Held notes past attack+decay with zero sustain (percussive patches,
+            # drums) produce an all-zero envelope for as long as the key is down.
+            # Every sample of such a buffer is silent, so only the envelope clock
+            # is advanced and oscillator/filter/DC work is skipped.
+            _silent_hold_t = (self.attack + self.decay) if self.sustain <= 0.0 else None
+
+            # Pass 1: per-voice control state (skip tests, velocity smoothing,
+            # glide).  Voices that will render are collected with their pitch so
+            # the primary oscillators can be generated in one batched call.
+            _oct_mult = self._octave_mult
+            _r2_ratio = 2.0 ** (self.rank2_detune / 1200.0)
+            _render = []
             for vi, v in enumerate(self.voices):
-                if v.note_active or v.is_releasing:
-                    # Smooth velocity to prevent attack peaks when notes change
-                    if abs(v.velocity_current - v.velocity_target) > 0.001:
-                        v.velocity_current = (v.velocity_current * self.velocity_smoothing
-                                            + v.velocity_target * (1.0 - self.velocity_smoothing))
-                    else:
-                        v.velocity_current = v.velocity_target
-                    v.velocity = v.velocity_current  # Update the velocity used in envelope/filter calculations
-
-                    p1_s, p2_s = v.phase, v.phase2
-
-                    # Portamento glide: smoothly interpolate v.frequency from the
-                    # source pitch toward base_frequency using exponential (log-linear)
-                    # interpolation.  Equal-tempered intervals all take the same time
-                    # regardless of size.  Updating v.frequency (not just f1) ensures
-                    # the key-tracking filter cutoff also glides in sync, eliminating
-                    # the abrupt coefficient jump that causes resonance spikes on note changes.
-                    if v._glide_from_freq > 0.0 and v.base_frequency:
-                        _glide_dur = max(1, int(self.portamento_time * self.sample_rate))
-                        _t = min(1.0, v._glide_elapsed / _glide_dur)
-                        # Exponential interpolation in frequency space = linear in semitones
-                        v.frequency = v._glide_from_freq * (v.base_frequency / v._glide_from_freq) ** _t
-                        v._glide_elapsed += frame_count
-                        if v._glide_elapsed >= _glide_dur:
-                            v._glide_from_freq = 0.0
-                            v.frequency = v.base_frequency
-
-                    f1 = v.frequency * vco_lfo if v.frequency else 440.0
-                    if self.octave_enabled and self.octave != 0: f1 *= (2.0 ** self.octave)
-
-                    # Generate primary oscillator with optional 4× oversampling.
-                    # Pass pre-allocated voice buffers (_v_osc_buf for waveform output,
-                    # _v_phase_arr for phase accumulation) to avoid malloc in hot path.
-                    oversample_factor = self.OVERSAMPLE_FACTOR if self.ENABLE_OVERSAMPLING else 1
+                if not (v.note_active or v.is_releasing):
+                    continue
+                if v.is_releasing:
+                    if v.release_start_level < 1e-6:
+                        # Released from a silent sustain: nothing left to fade.
+                        v.reset()
+                        continue
+                elif (_silent_hold_t is not None
+                        and v.envelope_time >= _silent_hold_t
+                        and v.steal_start_level <= 0.001):
+                    v.envelope_samples += frame_count
+                    v.last_envelope_level = 0.0
+                    continue
+                # Smooth velocity to prevent attack peaks when notes change
+                if abs(v.velocity_current - v.velocity_target) > 0.001:
+                    v.velocity_current = (v.velocity_current * self.velocity_smoothing
+                                        + v.velocity_target * (1.0 - self.velocity_smoothing))
+                else:
+                    v.velocity_current = v.velocity_target
+                v.velocity = v.velocity_current  # Update the velocity used in envelope/filter calculations
+
+                # Portamento glide: smoothly interpolate v.frequency from the
+                # source pitch toward base_frequency using exponential (log-linear)
+                # interpolation.  Equal-tempered intervals all take the same time
+                # regardless of size.  Updating v.frequency (not just f1) ensures
+                # the key-tracking filter cutoff also glides in sync, eliminating
+                # the abrupt coefficient jump that causes resonance spikes on note changes.
+                if v._glide_from_freq > 0.0 and v.base_frequency:
+                    _glide_dur = max(1, int(self.portamento_time * self.sample_rate))
+                    _t = min(1.0, v._glide_elapsed / _glide_dur)
+                    # Exponential interpolation in frequency space = linear in semitones
+                    v.frequency = v._glide_from_freq * (v.base_frequency / v._glide_from_freq) ** _t
+                    v._glide_elapsed += frame_count
+                    if v._glide_elapsed >= _glide_dur:
+                        v._glide_from_freq = 0.0
+                        v.frequency = v.base_frequency
+
+                f1 = v.frequency * vco_lfo if v.frequency else 440.0
+                if _oct_mult != 1.0: f1 *= _oct_mult
+
+                _render.append((vi, v, f1))
+
+            # Primary oscillators for every rendering voice at once, optionally
+            # 4× oversampled.  Rows of the engine's voice-major scratch matrix;
+            # noise waveforms have no phase state and stay per-voice.
+            oversample_factor = self.OVERSAMPLE_FACTOR if self.ENABLE_OVERSAMPLING else 1
+            if _render and self.waveform not in self._NOISE_WAVEFORMS:
+                _osc_rows = self._generate_waveform_voices(
+                    self.waveform, _render, frame_count, oversample_factor)
+            else:
+                _osc_rows = None
+
+            # Pass 2: per-voice signal chain.
+            _dc_voices = []
+            for _ri, (vi, v, f1) in enumerate(_render):
+                p2_s = v.phase2
+                if _osc_rows is not None:
+                    s1 = _osc_rows[_ri]
+                else:
                     s1, v.phase = self._generate_waveform(
-                        self.waveform, f1, frame_count, p1_s,
+                        self.waveform, f1, frame_count, v.phase,
                         oversample_factor=oversample_factor,
                         _out=v._v_osc_buf, _phases=v._v_phase_arr)
 
-                    # Downsample oscillator output from 192 kHz to 48 kHz if oversampling enabled.
-                    # Noise waveforms skip oversampling in _generate_waveform (they return
-                    # frame_count samples, not frame_count * oversample_factor), so only
-                    # downsample when the signal is actually at the oversampled length.
-                    if self.ENABLE_OVERSAMPLING and len(s1) == frame_count * oversample_factor:
-                        s1 = self._downsample_polyphase_signal(s1, self.OVERSAMPLE_FACTOR, history=v._oversample_history)
-
-                    # Pre-gate: S-curve fade-in for MONO/UNISON.  Applied between oscillator
-                    # and filter so the filter sees a smoothly changing input level.
-                    # Shape: (1 - cos(π·t)) / 2 gives zero slope at both endpoints —
-                    # no instantaneous amplitude steps at start or finish.
-                    # On voice steal, pre_gate_progress is inherited from the outgoing
-                    # voice so rapid re-triggers (key bounce, half-pressed contact) do NOT
-                    # reset the ramp back to zero and produce a stutter.  On first trigger
-                    # from silence, progress starts at 0.0 and ramps to 1.0 over 30ms.
-                    # Default progress=1.0 = fully open, no processing overhead.
-                    if (self.voice_type in ("mono", "unison")
-                            and v.pre_gate_progress < 1.0):
-                        _GATE_RAMP_S = 0.030 * self.sample_rate  # 30ms in samples
-                        _rate = 1.0 / _GATE_RAMP_S
-                        _prog_start = v.pre_gate_progress
-                        _prog_end = min(1.0, _prog_start + _rate * frame_count)
-                        # Allocation-free pre-gate ramp using shared ramp buffers.
-                        # _cb_ramp_buf holds the linear progress array [start, end].
-                        # _cb_ramp_cos holds the S-curve intermediate (cos computation).
-                        _prog_arr = self._fill_linspace(
-                            self._cb_ramp_buf, _prog_start, _prog_end, frame_count)
-                        np.clip(_prog_arr, 0.0, 1.0, out=_prog_arr)
-                        # S-curve: (1 - cos(π·t)) / 2 — zero slope at both endpoints.
-                        # Compute in-place: _cb_ramp_cos = cos(π * _prog_arr), then derive.
-                        np.multiply(_prog_arr, np.float32(np.pi), out=self._cb_ramp_cos[:frame_count])
-                        np.cos(self._cb_ramp_cos[:frame_count], out=self._cb_ramp_cos[:frame_count])
-                        _gate = self._cb_ramp_cos[:frame_count]
-                        _gate *= np.float32(-0.5)
-                        _gate += np.float32(0.5)
-                        v.pre_gate_progress = _prog_end
-                        s1 = s1 * _gate
-
-                    # Sine sub-oscillator mixed pre-filter so it's shaped by the
-                    # filter (and Filter EG) alongside the primary oscillator.
-                    if self.sine_mix > 0:
-                        ss, v.sine_phase = self._generate_waveform(
-                            "pure_sine", f1, frame_count, v.sine_phase,
-                            oversample_factor=oversample_factor,
-                            _out=v._v_osc_buf_sin, _phases=v._v_phase_arr)
-                        if self.ENABLE_OVERSAMPLING and len(ss) == frame_count * oversample_factor:
-                            ss = self._downsample_polyphase_signal(ss, self.OVERSAMPLE_FACTOR, history=v._oversample_history_sine)
-                        s1 = s1 + ss * self.sine_mix
-
-                    # Feature 3: Capacitor waveshaper — leaky integrator applied to
-                    # the oscillator output at 7% wet blend. At low pitches the
-                    # capacitor charges fully each cycle (near-identity). At high
-                    # pitches it barely moves, softening transient peaks. Models the
-                    # frequency-dependent waveshaping of a series capacitor in the
-                    # signal path of a real analog circuit.
-                    if v.frequency:
-                        _alpha_ws = min(0.92, 2.0 * math.pi * v.frequency / self.sample_rate * self._CAP_WS_RC)
-                        _cap_s    = v.cap_ws_state
-                        _ws_out   = v._v_cap_ws_buf[:frame_count]
+                # Downsample oscillator output from 192 kHz to 48 kHz if oversampling enabled.
+                # Noise waveforms skip oversampling in _generate_waveform (they return
+                # frame_count samples, not frame_count * oversample_factor), so only
+                # downsample when the signal is actually at the oversampled length.
+                if self.ENABLE_OVERSAMPLING and len(s1) == frame_count * oversample_factor:
+                    s1 = self._downsample_polyphase_signal(s1, self.OVERSAMPLE_FACTOR, history=v._oversample_history,
+                                                           out=self._cb_ds_out[0])
+
+                # Pre-gate: S-curve fade-in for MONO/UNISON.  Applied between oscillator
+                # and filter so the filter sees a smoothly changing input level.
+                # Shape: (1 - cos(π·t)) / 2 gives zero slope at both endpoints —
+                # no instantaneous amplitude steps at start or finish.
+                # On voice steal, pre_gate_progress is inherited from the outgoing
+                # voice so rapid re-triggers (key bounce, half-pressed contact) do NOT
+                # reset the ramp back to zero and produce a stutter.  On first trigger
+                # from silence, progress starts at 0.0 and ramps to 1.0 over 30ms.
+                # Default progress=1.0 = fully open, no processing overhead.
+                if (self.voice_type in ("mono", "unison")
+                        and v.pre_gate_progress < 1.0):
+                    _GATE_RAMP_S = 0.030 * self.sample_rate  # 30ms in samples
+                    _rate = 1.0 / _GATE_RAMP_S
+                    _prog_start = v.pre_gate_progress
+                    _prog_end = min(1.0, _prog_start + _rate * frame_count)
+                    # Allocation-free pre-gate ramp using shared ramp buffers.
+                    # _cb_ramp_buf holds the linear progress array [start, end].
+                    # _cb_ramp_cos holds the S-curve intermediate (cos computation).
+                    _prog_arr = self._fill_linspace(
+                        self._cb_ramp_buf, _prog_start, _prog_end, frame_count)
+                    np.clip(_prog_arr, 0.0, 1.0, out=_prog_arr)
+                    # S-curve: (1 - cos(π·t)) / 2 — zero slope at both endpoints.
+                    # Compute in-place: _cb_ramp_cos = cos(π * _prog_arr), then derive.
+                    np.multiply(_prog_arr, np.float32(np.pi), out=self._cb_ramp_cos[:frame_count])
+                    np.cos(self._cb_ramp_cos[:frame_count], out=self._cb_ramp_cos[:frame_count])
+                    _gate = self._cb_ramp_cos[:frame_count]
+                    _gate *= np.float32(-0.5)
+                    _gate += np.float32(0.5)
+                    v.pre_gate_progress = _prog_end
+                    s1 *= _gate
+
+                # Sine sub-oscillator mixed pre-filter so it's shaped by the
+                # filter (and Filter EG) alongside the primary oscillator.
+                if self.sine_mix > 0:
+                    ss, v.sine_phase = self._generate_waveform(
+                        "pure_sine", f1, frame_count, v.sine_phase,
+                        oversample_factor=oversample_factor,
+                        _out=v._v_osc_buf_sin, _phases=v._v_phase_arr)
+                    if self.ENABLE_OVERSAMPLING and len(ss) == frame_count * oversample_factor:
+                        ss = self._downsample_polyphase_signal(ss, self.OVERSAMPLE_FACTOR, history=v._oversample_history_sine,
+                                                               out=self._cb_ds_out[1])
+                    ss *= self.sine_mix
+                    s1 += ss
+
+                # Feature 3: Capacitor waveshaper — leaky integrator applied to
+                # the oscillator output at 7% wet blend. At low pitches the
+                # capacitor charges fully each cycle (near-identity). At high
+                # pitches it barely moves, softening transient peaks. Models the
+                # frequency-dependent waveshaping of a series capacitor in the
+                # signal path of a real analog circuit.
+                if v.frequency:
+                    _alpha_ws = min(0.92, v.frequency * self._two_pi_over_sr * self._CAP_WS_RC)
+                    _cap_s    = v.cap_ws_state
+                    _ws_out   = v._v_cap_ws_buf[:frame_count]
+                    if _dsp_kernels.NUMBA_AVAILABLE:
+                        _cap_s = _dsp_kernels.leaky_integrator_kernel(s1, _ws_out, _alpha_ws, _cap_s)
+                    else:
                         for _k in range(frame_count):
                             _cap_s    += _alpha_ws * (float(s1[_k]) - _cap_s)
                             _ws_out[_k] = _cap_s
-                        v.cap_ws_state = _cap_s
-                        s1 = s1 * (1.0 - self._CAP_WS_BLEND) + _ws_out * self._CAP_WS_BLEND
-
-                    # Feature B: Peak-to-peak detector — models soft saturation of an
-                    # analog oscillator stage exceeding its linear range. Positive and
-                    # negative envelopes are tracked independently with instant attack
-                    # (diode forward-bias) and ~300 ms decay. When their combined swing
-                    # exceeds the threshold, a blend of gain-reduced signal is mixed in
-                    # at 15% wet — very subtle, adds analog texture at high velocities.
-                    _buf_max = float(np.max(s1))
-                    _buf_min = float(np.min(s1))
-                    _pp_decay_buf = self._CAP_PP_DECAY ** frame_count
-                    if _buf_max > v.osc_peak_pos:
-                        v.osc_peak_pos = _buf_max
-                    else:
-                        v.osc_peak_pos *= _pp_decay_buf
-                    if _buf_min < v.osc_peak_neg:
-                        v.osc_peak_neg = _buf_min
-                    else:
-                        v.osc_peak_neg *= _pp_decay_buf
-                    _pp_swing = v.osc_peak_pos - v.osc_peak_neg
-                    if _pp_swing > self._CAP_PP_THRESH:
-                        _pp_gain = self._CAP_PP_THRESH / _pp_swing
-                        s1 = s1 * (1.0 - self._CAP_PP_BLEND) + s1 * _pp_gain * self._CAP_PP_BLEND
-
-                    # Filter EG: compute per-buffer scalar and add to vcf_lfo modulation.
-                    # feg_value is 0→1; scaled by feg_amount×_FEG_MAX_SWEEP_HZ and added
-                    # to the base cutoff inside _apply_filter via cutoff_mod offset.
-                    # When feg_amount==0.0 _compute_feg_value fast-paths to 0.0 with no overhead.
-                    feg_val = self._compute_feg_value(v, frame_count)
-                    feg_cutoff_offset = self.feg_amount * self._FEG_MAX_SWEEP_HZ * feg_val
-                    # Pass as a combined modulator: vcf_lfo handles LFO ratio, FEG adds Hz offset.
-                    # _apply_filter receives cutoff_mod as a multiplier; we encode the offset by
-                    # adjusting the target cutoff temporarily per-voice via a local variable.
-                    # Noise blend pre-filter: pink noise summed into the oscillator signal
-                    # before the VCF so the filter shapes the noise alongside the tone.
-                    # Real analog synths route the noise source into the VCF; this gives
-                    # the noise breath and musicality instead of harsh full-bandwidth hiss.
-                    # Pink noise (1/f spectrum) has rolled-off highs; much warmer than white.
-                    # Square-root curve on the mix keeps low values subtle (analog noise floor
-                    # character) while still allowing aggressive sweeps at higher settings.
-                    if self.noise_level_current > 0:
-                        noise_gain = math.sqrt(self.noise_level_current) * 0.25
-                        pink = self._generate_pink_noise(frame_count)
-                        s1 = s1 + pink * noise_gain
-
-                    _base_cutoff = self.cutoff_current
-                    self.cutoff_current = float(np.clip(_base_cutoff + feg_cutoff_offset, 20.0, 20000.0))
-                    s1 = self._sanitize_signal(self._apply_filter(v, s1, rank=1, cutoff_mod=vcf_lfo))
-                    self.cutoff_current = _base_cutoff  # restore immediately after filter call
-
+                    v.cap_ws_state = _cap_s
+                    s1 *= 1.0 - self._CAP_WS_BLEND
+                    _ws_out *= self._CAP_WS_BLEND
+                    s1 += _ws_out
+
+                # Feature B: Peak-to-peak detector — models soft saturation of an
+                # analog oscillator stage exceeding its linear range. Positive and
+                # negative envelopes are tracked independently with instant attack
+                # (diode forward-bias) and ~300 ms decay. When their combined swing
+                # exceeds the threshold, a blend of gain-reduced signal is mixed in
+                # at 15% wet — very subtle, adds analog texture at high velocities.
+                _buf_max = float(np.max(s1))
+                _buf_min = float(np.min(s1))
+                _pp_decay_buf = self._CAP_PP_DECAY ** frame_count
+                if _buf_max > v.osc_peak_pos:
+                    v.osc_peak_pos = _buf_max
+                else:
+                    v.osc_peak_pos *= _pp_decay_buf
+                if _buf_min < v.osc_peak_neg:
+                    v.osc_peak_neg = _buf_min
+                else:
+                    v.osc_peak_neg *= _pp_decay_buf
+                _pp_swing = v.osc_peak_pos - v.osc_peak_neg
+                if _pp_swing > self._CAP_PP_THRESH:
+                    _pp_gain = self._CAP_PP_THRESH / _pp_swing
+                    s1 *= (1.0 - self._CAP_PP_BLEND) + _pp_gain * self._CAP_PP_BLEND
+
+                # Filter EG: compute per-buffer scalar and add to vcf_lfo modulation.
+                # feg_value is 0→1; scaled by feg_amount×_FEG_MAX_SWEEP_HZ and added
+                # to the base cutoff inside _apply_filter via cutoff_mod offset.
+                # When feg_amount==0.0 _compute_feg_value fast-paths to 0.0 with no overhead.
+                feg_val = self._compute_feg_value(v, frame_count)
+                feg_cutoff_offset = self.feg_amount * self._FEG_MAX_SWEEP_HZ * feg_val
+                # Pass as a combined modulator: vcf_lfo handles LFO ratio, FEG adds Hz offset.
+                # _apply_filter receives cutoff_mod as a multiplier; we encode the offset by
+                # adjusting the target cutoff temporarily per-voice via a local variable.
+                # Noise blend pre-filter: pink noise summed into the oscillator signal
+                # before the VCF so the filter shapes the noise alongside the tone.
+                # Real analog synths route the noise source into the VCF; this gives
+                # the noise breath and musicality instead of harsh full-bandwidth hiss.
+                # Pink noise (1/f spectrum) has rolled-off highs; much warmer than white.
+                # Square-root curve on the mix keeps low values subtle (analog noise floor
+                # character) while still allowing aggressive sweeps at higher settings.
+                if self.noise_level_current > 0:
+                    noise_gain = math.sqrt(self.noise_level_current) * 0.25
+                    pink = self._generate_pink_noise(frame_count)
+                    pink *= noise_gain
+                    s1 += pink
+
+                _base_cutoff = self.cutoff_current
+                self.cutoff_current = min(20000.0, max(20.0, float(_base_cutoff + feg_cutoff_offset)))
+                s1 = self._sanitize_signal(self._apply_filter(v, s1, rank=1, cutoff_mod=vcf_lfo))
+                self.cutoff_current = _base_cutoff  # restore immediately after filter call
+
+                if self.rank2_enabled and self.rank2_mix > 0.0:
+                    f2 = f1 * _r2_ratio
+                    s2, v.phase2 = self._generate_waveform(
+                        self.rank2_waveform, f2, frame_count, p2_s,
+                        oversample_factor=oversample_factor,
+                        _out=v._v_osc_buf_r2, _phases=v._v_phase_arr)
+
+                    # Downsample rank 2 oscillator output if oversampling enabled.
+                    # Guard length: noise waveforms return frame_count samples, not oversampled.
+                    if self.ENABLE_OVERSAMPLING and len(s2) == frame_count * oversample_factor:
+                        s2 = self._downsample_polyphase_signal(s2, self.OVERSAMPLE_FACTOR, history=v._oversample_history_r2,
+                                                               out=self._cb_ds_out[2])
+
+                    self.cutoff_current = min(20000.0, max(20.0, float(_base_cutoff + feg_cutoff_offset)))
+                    s2 = self._sanitize_signal(self._apply_filter(v, s2, rank=2, cutoff_mod=vcf_lfo))
+                    self.cutoff_current = _base_cutoff
+                    s1 *= 1.0 - self.rank2_mix
+                    s2 *= self.rank2_mix
+                    s1 += s2
+                    v_samples = s1
+                else:
                     if self.rank2_enabled:
-                        f2 = f1 * (2.0 ** (self.rank2_detune / 1200.0))
-                        s2, v.phase2 = self._generate_waveform(
-                            self.rank2_waveform, f2, frame_count, p2_s,
-                            oversample_factor=oversample_factor,
-                            _out=v._v_osc_buf_r2, _phases=v._v_phase_arr)
-
-                        # Downsample rank 2 oscillator output if oversampling enabled.
-                        # Guard length: noise waveforms return frame_count samples, not oversampled.
-                        if self.ENABLE_OVERSAMPLING and len(s2) == frame_count * oversample_factor:
-                            s2 = self._downsample_polyphase_signal(s2, self.OVERSAMPLE_FACTOR, history=v._oversample_history_r2)
-
-                        self.cutoff_current = float(np.clip(_base_cutoff + feg_cutoff_offset, 20.0, 20000.0))
-                        s2 = self._sanitize_signal(self._apply_filter(v, s2, rank=2, cutoff_mod=vcf_lfo))
-                        self.cutoff_current = _base_cutoff
-                        v_samples = s1 * (1.0 - self.rank2_mix) + s2 * self.rank2_mix
-                    else:
-                        v_samples = s1
-
-                    v_samples = self._apply_envelope(
-                        v, v_samples, frame_count,
-                        _env_buf=v._v_env_buf, _times_buf=v._v_times_buf) * vca_lfo
-                    # Per-voice onset ramp: a frequency-adaptive linear fade-in applied
-                    # to the post-envelope signal before the DC blocker.  The DC blocker
-                    # resets to zero on every new trigger; if the signal is non-zero at
-                    # sample 0 the blocker differentiates a large first step into a
-                    # high-frequency click. Fading in over ONSET_RAMP samples ensures
-                    # the blocker starts from near-zero signal regardless of oscillator
-                    # phase or attack setting.
-                    #
-                    # Duration = v.onset_ms (set at trigger time to max(3ms, min(30ms,
-                    # 1.5 × period_ms))).  At 440 Hz this is 3ms (~144 smp, unchanged).
-                    # At 55 Hz this is 27ms (~1296 smp), covering the DC blocker's full
-                    # settling time at that frequency.
-                    ONSET_RAMP = int(self.sample_rate * v.onset_ms / 1000.0)
-                    if v.onset_samples < ONSET_RAMP:
-                        n = min(frame_count, ONSET_RAMP - v.onset_samples)
-                        # Use pre-allocated onset ramp buffer.
-                        # Default value is 1.0 (flat); only the first n samples need updating.
-                        ramp = v._v_onset_ramp[:frame_count]
-                        ramp.fill(1.0)
-                        # Feature 4: RC gate curve — exponential RC charge shape
-                        # replaces the linear ramp. Models a capacitor on the gate
-                        # signal: fast initial rise then gradual approach to 1.0,
-                        # characteristic of real analog gate circuitry.
-                        _t_arr = np.linspace(v.onset_samples / ONSET_RAMP,
-                                             min((v.onset_samples + n) / ONSET_RAMP, 1.0),
-                                             n, dtype=np.float32)
-                        ramp[:n] = 1.0 - np.exp(-_t_arr / self._CAP_GATE_TAU)
-                        ramp[:n] /= np.float32(1.0 - math.exp(-1.0 / self._CAP_GATE_TAU))
-                        v_samples = v_samples * ramp
-                        v.onset_samples += frame_count
-                    # Feature C: Output peak soft limiter — gentle dynamic ceiling.
-                    # Tracks the peak of this voice's output with instant attack and
-                    # ~300 ms decay. When the tracked peak exceeds the threshold, a
-                    # proportional gain reduction (max 8%) is applied. Applied before
-                    # the DC blocker so no gain step is injected into the blocker state.
-                    _out_buf_peak = float(np.max(np.abs(v_samples)))
-                    if _out_buf_peak > v.out_peak:
-                        v.out_peak = _out_buf_peak
-                    else:
-                        v.out_peak *= self._CAP_OUT_DECAY ** frame_count
-                    if v.out_peak > self._CAP_OUT_THRESH:
-                        _out_excess = (v.out_peak - self._CAP_OUT_THRESH) / (1.0 - self._CAP_OUT_THRESH)
-                        _out_gain = max(self._CAP_OUT_MIN_GAIN, 1.0 - self._CAP_OUT_DEPTH * _out_excess)
-                        v_samples = v_samples * np.float32(_out_gain)
-                    v_samples = self._apply_dc_blocker(v, v_samples)
-                    if self.voice_type == "unison":
-                        # Map each voice's detune position to the stereo field.
-                        # Voice index 0 = most negative detune → full left (pan=0.0).
-                        # Voice index N-1 = most positive detune → full right (pan=1.0).
-                        # This links pitch position to spatial position, giving the
-                        # characteristic "wide sweep" of professional unison sounds.
-                        n_v = len(self.voices)
-                        unison_pan = vi / max(n_v - 1, 1)
-                        ang = unison_pan * np.pi / 2
-                        # 1/sqrt(N) normalization: detuned voices are partially decorrelated
-                        # (different phases + beating), so RMS sum grows as sqrt(N), not N.
-                        # 1/N was too quiet; 1/sqrt(N) gives perceptually consistent loudness
-                        # whether 2 or 8 voices are stacked.
-                        mix_scale = 1.0 / math.sqrt(self.num_voices)
-                    else:
-                        ang = v.pan * np.pi / 2
-                        mix_scale = 1.0
-                    mixed_l += v_samples * np.cos(ang) * mix_scale
-                    mixed_r += v_samples * np.sin(ang) * mix_scale
+                        # Rank 2 is on but mixed at zero: advance its free-running
+                        # phase without rendering, downsampling and filtering a
+                        # signal that would only be multiplied by 0.
+                        f2 = f1 * _r2_ratio
+                        v.phase2 = (p2_s + f2 * frame_count * self._two_pi_over_sr) % _TWO_PI
+                    v_samples = s1
+
+                v_samples = self._apply_envelope(
+                    v, v_samples, frame_count,
+                    _env_buf=v._v_env_buf, _times_buf=v._v_times_buf)
+                v_samples *= vca_lfo
+                # Per-voice onset ramp: a frequency-adaptive linear fade-in applied
+                # to the post-envelope signal before the DC blocker.  The DC blocker
+                # resets to zero on every new trigger; if the signal is non-zero at
+                # sample 0 the blocker differentiates a large first step into a
+                # high-frequency click. Fading in over ONSET_RAMP samples ensures
+                # the blocker starts from near-zero signal regardless of oscillator
+                # phase or attack setting.
+                #
+                # Duration = v.onset_ms (set at trigger time to max(3ms, min(30ms,
+                # 1.5 × period_ms))).  At 440 Hz this is 3ms (~144 smp, unchanged).
+                # At 55 Hz this is 27ms (~1296 smp), covering the DC blocker's full
+                # settling time at that frequency.
+                self._apply_onset_ramp(v, v_samples, frame_count)
+                # Feature C: Output peak soft limiter — gentle dynamic ceiling.
+                # Tracks the peak of this voice's output with instant attack and
+                # ~300 ms decay. When the tracked peak exceeds the threshold, a
+                # proportional gain reduction (max 8%) is applied. Applied before
+                # the DC blocker so no gain step is injected into the blocker state.
+                _out_buf_peak = max(float(v_samples.max()), -float(v_samples.min()))
+                if _out_buf_peak > v.out_peak:
+                    v.out_peak = _out_buf_peak
+                else:
+                    v.out_peak *= self._CAP_OUT_DECAY ** frame_count
+                if v.out_peak > self._CAP_OUT_THRESH:
+                    _out_excess = (v.out_peak - self._CAP_OUT_THRESH) / (1.0 - self._CAP_OUT_THRESH)
+                    _out_gain = max(self._CAP_OUT_MIN_GAIN, 1.0 - self._CAP_OUT_DEPTH * _out_excess)
+                    v_samples *= np.float32(_out_gain)
+                # Park the voice's signal in its output row; the DC blocker runs
+                # for all rendered voices at once after the loop.
+                np.copyto(v._v_dc_buf[:frame_count], v_samples, casting='same_kind')
+                _dc_voices.append((vi, v))
+
+            if _dc_voices:
+                self._apply_dc_blocker_voices(_dc_voices, frame_count)
+                if self.voice_type == "unison":
+                    # Map each voice's detune position to the stereo field.
+                    # Voice index 0 = most negative detune → full left (pan=0.0).
+                    # Voice index N-1 = most positive detune → full right (pan=1.0).
+                    # This links pitch position to spatial position, giving the
+                    # characteristic "wide sweep" of professional unison sounds.
+                    # The gains carry 1/sqrt(N) normalization: detuned voices are
+                    # partially decorrelated (different phases + beating), so RMS sum
+                    # grows as sqrt(N), not N.  1/N was too quiet; 1/sqrt(N) gives
+                    # perceptually consistent loudness whether 2 or 8 voices are stacked.
+                    _gl, _gr = self._unison_gain_l, self._unison_gain_r
+                else:
+                    _gl, _gr = self._pan_gain_l, self._pan_gain_r
+                # Mix both channels in one (2 x voices) @ (voices x frames)
+                # product straight into the L/R buses.  When the rendered voices
+                # are the leading slots (all of UNISON, and POLY until a low slot
+                # frees up) their output rows are used in place; otherwise they
+                # are gathered first, since skipped voices' rows hold stale output.
+                _nr = len(_dc_voices)
+                _gain = self._cb_mix_gain
+                _contiguous = _dc_voices[-1][0] == _nr - 1
+                _rows = self._voice_out_mat if _contiguous else self._cb_mix_rows
+                for r, (vi, _v) in enumerate(_dc_voices):
+                    _gain[0, r] = _gl[vi]
+                    _gain[1, r] = _gr[vi]
+                    if not _contiguous:
+                        _rows[r] = self._voice_out_mat[vi]
+                np.matmul(_gain[:, :_nr], _rows[:_nr, :frame_count],
+                          out=self._cb_mixed_lr[:, :frame_count])
+            else:
+                self._cb_mixed_lr[:, :frame_count].fill(0.0)
 
             # Ghost voice mix: draining release tails from promoted-but-stolen voices.
             # Ghost voices run the same signal chain as real voices but output at a
             # reduced gain (0.7×) and are never counted in the gain normalisation.
             # Pan uses centre (ang=π/4) so ghost tails are not spatially distracting.
-            _GHOST_GAIN = 0.7
-            _ghost_ang  = np.pi / 4.0   # centre pan
+            # cos(π/4) == sin(π/4), so both channels take one precomputed gain.
+            _ghost_gain = self._GHOST_PAN_GAIN
             for g in self._ghost_voices:
                 if g.is_ghost and (g.note_active or g.is_releasing):
                     f_g = g.frequency if g.frequency else 440.0
-                    if self.octave_enabled and self.octave != 0:
-                        f_g *= (2.0 ** self.octave)
+                    if self._octave_mult != 1.0:
+                        f_g *= self._octave_mult
                     oversample_factor = self.OVERSAMPLE_FACTOR if self.ENABLE_OVERSAMPLING else 1
                     gs, g.phase = self._generate_waveform(self.waveform, f_g, frame_count, g.phase, oversample_factor=oversample_factor)
                     if self.ENABLE_OVERSAMPLING and len(gs) == frame_count * oversample_factor:
-                        gs = self._downsample_polyphase_signal(gs, self.OVERSAMPLE_FACTOR, history=g._oversample_history)
+                        gs = self._downsample_polyphase_signal(gs, self.OVERSAMPLE_FACTOR, history=g._oversample_history,
+                                                               out=self._cb_ds_out[0])
                     gs = self._sanitize_signal(self._apply_filter(g, gs))
                     gs = self._sanitize_signal(self._apply_envelope(g, gs, frame_count,
                                                                      _env_buf=g._v_env_buf,
                                                                      _times_buf=g._v_times_buf))
-                    ONSET_RAMP = int(self.sample_rate * g.onset_ms / 1000.0)
-                    if g.onset_samples < ONSET_RAMP:
-                        n = min(frame_count, ONSET_RAMP - g.onset_samples)
-                        ramp = g._v_onset_ramp[:frame_count]
-                        ramp.fill(1.0)
-                        # Feature 4: RC gate curve (ghost voice path — same formula).
-                        _t_arr = np.linspace(g.onset_samples / ONSET_RAMP,
-                                             min((g.onset_samples + n) / ONSET_RAMP, 1.0),
-                                             n, dtype=np.float32)
-                        ramp[:n] = 1.0 - np.exp(-_t_arr / self._CAP_GATE_TAU)
-                        ramp[:n] /= np.float32(1.0 - math.exp(-1.0 / self._CAP_GATE_TAU))
-                        gs[:n] = gs[:n] * ramp[:n]
-                        g.onset_samples += frame_count
+                    self._apply_onset_ramp(g, gs, frame_count)
                     gs = self._apply_dc_blocker(g, gs)
-                    mixed_l += gs * np.cos(_ghost_ang) * _GHOST_GAIN
-                    mixed_r += gs * np.sin(_ghost_ang) * _GHOST_GAIN
+                    gs *= _ghost_gain
+                    mixed_l += gs
+                    mixed_r += gs
 
             # ── BBD-style Chorus (bypass when chorus_mix == 0) ───────────────
             # All taps read from the same shared ring buffer. Four LFO phases
@@ -3229,11 +3995,11 @@ class SynthEngine:
             # across buffer boundaries. Base delay 0.5ms + depth-modulated swing
             # up to ±25ms. wet/dry mix controls the blend.
             if self.ENABLE_CHORUS and self.chorus_mix > 0.0:
-                n_voices  = int(np.clip(self.chorus_voices, 1, 4))
+                n_voices  = min(4, max(1, int(self.chorus_voices)))
                 buf_len   = len(self._chorus_buf_l)
                 max_dly_s = self.sample_rate * 0.025   # 25 ms in samples
                 base_dly  = max(1, int(self.sample_rate * 0.0005))   # 0.5 ms base
-                phase_inc = 2.0 * np.pi * self.chorus_rate / self.sample_rate
+                phase_inc = self.chorus_rate * self._two_pi_over_sr
                 # Vectorized chorus: compute all frame_count write/read positions
                 # at once using numpy array ops instead of a Python per-sample loop.
                 # Replaces O(frame_count × n_voices) Python iterations with BLAS-level
@@ -3257,13 +4023,28 @@ class SynthEngine:
                 wet_r = self._cb_wet_r[:frame_count]
                 wet_l.fill(0.0)
                 wet_r.fill(0.0)
-                sample_f = idx_fc + 1.0  # 1-based sample offsets for phase advance
+                # 1-based sample offsets for phase advance; the float index
+                # scratch is free again once the write positions are stored.
+                sample_f = np.add(idx_fc, np.float32(1.0), out=self._cb_idx_f[:frame_count])
+                phases = self._cb_cho_ph[:frame_count]
+                rp = self._cb_cho_rd_idx[:frame_count]
+                tap = self._cb_cho_tap[:frame_count]
                 for vi in range(n_voices):
-                    phases = (self._chorus_phases[vi] + phase_inc * sample_f) % (2.0 * np.pi)
-                    mod_smp = (np.sin(phases) * self.chorus_depth * max_dly_s).astype(np.int32)
-                    rp = (write_pos - np.maximum(1, base_dly + mod_smp)) % buf_len
-                    wet_l += self._chorus_buf_l[rp]
-                    wet_r += self._chorus_buf_r[rp]
+                    np.multiply(sample_f, phase_inc, out=phases)
+                    phases += self._chorus_phases[vi]
+                    np.mod(phases, _TWO_PI, out=phases)
+                    np.sin(phases, out=tap)
+                    tap *= self.chorus_depth
+                    tap *= max_dly_s
+                    rp[:] = tap                      # truncates toward zero, as astype did
+                    rp += base_dly
+                    np.maximum(rp, 1, out=rp)
+                    np.subtract(write_pos, rp, out=rp)
+                    np.mod(rp, buf_len, out=rp)
+                    np.take(self._chorus_buf_l, rp, out=tap)
+                    wet_l += tap
+                    np.take(self._chorus_buf_r, rp, out=tap)
+                    wet_r += tap
                     self._chorus_phases[vi] = float(phases[-1])
                 self._chorus_write = int((write_pos[-1] + 1) % buf_len)
 
@@ -3272,9 +4053,11 @@ class SynthEngine:
                 cho_l = self._cb_cho_l[:frame_count]
                 cho_r = self._cb_cho_r[:frame_count]
                 np.multiply(mixed_l, 1.0 - mx, out=cho_l)
-                cho_l += wet_l * (scale * mx)
+                wet_l *= scale * mx
+                cho_l += wet_l
                 np.multiply(mixed_r, 1.0 - mx, out=cho_r)
-                cho_r += wet_r * (scale * mx)
+                wet_r *= scale * mx
+                cho_r += wet_r
                 mixed_l = cho_l
                 mixed_r = cho_r
 
@@ -3321,21 +4104,31 @@ class SynthEngine:
                         mixed_r[i] = mixed_r[i] * (1.0 - dm) + wet_r * dm
                         self._delay_write = (wp + 1) % buf_len
 
-            # comp normalises waveform RMS to roughly the same perceived loudness.
+            # The waveform ceiling normalises waveform RMS to roughly the same perceived loudness.
             # Kept intentionally modest (≤1.0 for sine) so that at default amp_level
             # (0.75) and sustain (0.7) the pre-tanh drive stays below ~0.5 — well
             # inside tanh's linear region.  This prevents the attack transient from
             # saturating harder than the sustain, which was causing the visible
             # peak-then-sag shape in recorded waveforms.
 
+            # The fades below are linear gains applied before tanh, so when no
+            # metronome click is added to the mix this buffer they are folded
+            # into gain_ramp: one multiply per channel at the drive stage instead
+            # of one per fade.  With a click pending they scale the mix directly
+            # so the click itself is never faded.
+            _fold_fades = self._metro_click_buf is None
+
             # --- Filter mode switch anti-click: fade in the mix over ~10.7 ms ---
             # Applied before tanh so the linear ramp is not distorted by high drive.
             if self._filter_ramp_remaining > 0:
                 ramp_start = 1.0 - (self._filter_ramp_remaining / self._FILTER_RAMP_LEN)
                 ramp_end   = 1.0 - max(0, self._filter_ramp_remaining - frame_count) / self._FILTER_RAMP_LEN
                 ramp = self._fill_linspace(self._cb_ramp_buf, ramp_start, ramp_end, frame_count)
-                mixed_l *= ramp
-                mixed_r *= ramp
+                if _fold_fades:
+                    gain_ramp *= ramp
+                else:
+                    mixed_l *= ramp
+                    mixed_r *= ramp
                 self._filter_ramp_remaining = max(0, self._filter_ramp_remaining - frame_count)
 
             # --- Randomize mute gate: ~8ms fade-out then ~8ms fade-in (~384 smp each) ---
@@ -3349,8 +4142,11 @@ class SynthEngine:
                 ramp_start = self._mute_ramp_remaining / self._MUTE_RAMP_LEN
                 ramp_end   = max(0, self._mute_ramp_remaining - frame_count) / self._MUTE_RAMP_LEN
                 ramp = self._fill_linspace(self._cb_ramp_buf, ramp_start, ramp_end, frame_count)
-                mixed_l *= ramp
-                mixed_r *= ramp
+                if _fold_fades:
+                    gain_ramp *= ramp
+                else:
+                    mixed_l *= ramp
+                    mixed_r *= ramp
                 self._mute_ramp_remaining = max(0, self._mute_ramp_remaining - frame_count)
                 if self._mute_ramp_remaining == 0:
                     if self._pending_all_notes_off:
@@ -3371,8 +4167,11 @@ class SynthEngine:
                 ramp_start = 1.0 - (self._mute_ramp_fadein / self._MUTE_RAMP_LEN)
                 ramp_end   = 1.0 - max(0, self._mute_ramp_fadein - frame_count) / self._MUTE_RAMP_LEN
                 ramp = self._fill_linspace(self._cb_ramp_buf, ramp_start, ramp_end, frame_count)
-                mixed_l *= ramp
-                mixed_r *= ramp
+                if _fold_fades:
+                    gain_ramp *= ramp
+                else:
+                    mixed_l *= ramp
+                    mixed_r *= ramp
                 self._mute_ramp_fadein = max(0, self._mute_ramp_fadein - frame_count)
 
             # Waveform saturation ceiling: controls how early the tanh soft-clips.
@@ -3382,7 +4181,8 @@ class SynthEngine:
             # give sine a marginally softer saturation knee, while staying close enough
             # in level that the difference is inaudible at normal drive settings.
             # Saw and triangle are at unity (1.0); same RMS, same saturation character.
-            comp = 0.95 if self.waveform in ["sine", "pure_sine"] else (0.75 if self.waveform == "square" else 1.0)
+            # (_WAVE_CEILING, cached per waveform by _refresh_master_consts.)
+            ceiling = self._wave_ceiling
 
             # Perceptual loudness compensation for octave position.
             # Low octaves (32', 16') lose perceived punch due to the ear's reduced
@@ -3391,8 +4191,7 @@ class SynthEngine:
             # boost feeds naturally into the saturation curve at high drive values,
             # adding warmth rather than just raw level. Higher octaves (4', 2') are
             # already bright and perceived as louder — no compensation needed.
-            _OCTAVE_COMP = {-2: 1.25, -1: 1.12, 0: 1.0, 1: 1.0, 2: 1.0}
-            octave_comp = _OCTAVE_COMP.get(self.octave, 1.0)
+            octave_comp = self._octave_comp
 
             # Mix metronome clicks into the synth signal BEFORE saturation.
             # This ensures they go through the normal tanh curve and are never lost
@@ -3411,15 +4210,10 @@ class SynthEngine:
             # at ±ceiling. filter_drive (applied post-ladder per voice) pushes the
             # mixed signal above the ceiling, causing progressive saturation.
             # At drive=1.0 the signal sits well below ceiling — gentle saturation.
-            # Saturation ceiling is fixed at comp (waveform RMS compensation only).
+            # Saturation ceiling is fixed per waveform (RMS compensation only).
             # amp_level is applied as a post-tanh linear gain so that changing the amp
             # knob only scales loudness — it never reshapes the tanh saturation curve,
             # which would cause audible waveform-character artifacts mid-note.
-            ceiling = max(comp, 0.01)
-            mixed_l *= gain_ramp
-            mixed_r *= gain_ramp
-            mixed_l *= octave_comp
-            mixed_r *= octave_comp
             # Makeup gain: constant-power stereo panning (cos/sin at 45°) costs
             # ~3 dB per channel on centre-panned voices.  Combined with conservative
             # per-voice normalization this leaves roughly -8 dBFS of headroom unused
@@ -3428,17 +4222,23 @@ class SynthEngine:
             # natural analog warmth.  Applied before drive so high-drive presets
             # are unaffected (tanh already saturates fully at drive >= 2).
             _MAKEUP_GAIN = 1.4
-            mixed_l *= _MAKEUP_GAIN
-            mixed_r *= _MAKEUP_GAIN
             # Drive applied here — after _sanitize_signal has already guarded per-voice
             # filter output. Multiplying the summed mix by filter_drive pushes the signal
             # above ceiling into tanh saturation. drive=1.0 leaves the signal near the
             # linear region (gentle warmth). drive=8.0 pushes it 8× above ceiling,
             # producing heavy clipping and rich odd/even harmonics.
-            mixed_l *= self.filter_drive_current
-            mixed_r *= self.filter_drive_current
-            mixed_l = np.tanh(mixed_l / ceiling) * ceiling * self.amp_level_current * self.master_volume
-            mixed_r = np.tanh(mixed_r / ceiling) * ceiling * self.amp_level_current * self.master_volume
+            #
+            # All pre-tanh scalars (octave comp, makeup, drive, 1/ceiling) are folded
+            # into the shared gain ramp once, so each channel takes a single multiply
+            # pass; the post-tanh scalars (ceiling, amp, master) are likewise one
+            # product.  tanh and both multiplies run in place in the pre-allocated
+            # mix buffers.
+            gain_ramp *= (octave_comp * _MAKEUP_GAIN * self.filter_drive_current) / ceiling
+            _post_gain = ceiling * self.amp_level_current * self.master_volume
+            for _ch in (mixed_l, mixed_r):
+                _ch *= gain_ramp
+                np.tanh(_ch, out=_ch)
+                _ch *= _post_gain
 
             # Engine-level inter-buffer crossfade: blend from the last buffer's final
             # post-tanh output toward the new output over _TRANSITION_XF_SAMPLES samples.
@@ -3455,27 +4255,51 @@ class SynthEngine:
             # Subsonic high-pass (20 Hz, 1-pole IIR) on the stereo mix bus.
             # Recurrence: y[n] = (1-alpha)*y[n-1] + (1-alpha)*(x[n] - x[n-1])
             # Equivalent to: y[n] = x[n] - x[n-1] + (1-alpha)*y[n-1]
-            # Applied in-place; state persists across buffer boundaries.
+            # Applied in-place; state persists across buffer boundaries, followed
+            # by an in-place clip to ±1.  The numba kernel does both in one pass;
+            # otherwise scipy runs the recurrence (zi = c·y[-1] - x[-1] in its
+            # transposed form) and the Python loop is the last resort.
             _hp_a   = self._sub_hp_alpha
             _hp_1ma = 1.0 - _hp_a
-            _xl, _yl = self._sub_hp_x_l, self._sub_hp_y_l
-            _xr, _yr = self._sub_hp_x_r, self._sub_hp_y_r
-            for _i in range(frame_count):
-                _xl_new = mixed_l[_i]
-                _yl_new = _xl_new - _xl + _hp_1ma * _yl
-                mixed_l[_i] = _yl_new
-                _xl, _yl = _xl_new, _yl_new
-                _xr_new = mixed_r[_i]
-                _yr_new = _xr_new - _xr + _hp_1ma * _yr
-                mixed_r[_i] = _yr_new
-                _xr, _yr = _xr_new, _yr_new
-            self._sub_hp_x_l, self._sub_hp_y_l = _xl, _yl
-            self._sub_hp_x_r, self._sub_hp_y_r = _xr, _yr
-
-            # Tier 3: in-place clip — avoids creating two new 480-element arrays per buffer.
-            # mixed_l/mixed_r already live in pre-allocated _cb_mixed_l/r; clip to ±1 in-place.
-            np.clip(mixed_l, -1.0, 1.0, out=mixed_l)
-            np.clip(mixed_r, -1.0, 1.0, out=mixed_r)
+            if _dsp_kernels.NUMBA_AVAILABLE:
+                (self._sub_hp_x_l, self._sub_hp_y_l,
+                 self._sub_hp_x_r, self._sub_hp_y_r) = _dsp_kernels.stereo_highpass_clip_kernel(
+                    mixed_l, mixed_r, _hp_1ma,
+                    self._sub_hp_x_l, self._sub_hp_y_l,
+                    self._sub_hp_x_r, self._sub_hp_y_r)
+            else:
+                if self._scipy_lfilter is not None:
+                    _hp_den = [1.0, -_hp_1ma]
+                    _xl = float(mixed_l[-1])
+                    _yl_arr, _ = self._scipy_lfilter(
+                        _DC_B, _hp_den, mixed_l,
+                        zi=[_hp_1ma * self._sub_hp_y_l - self._sub_hp_x_l])
+                    mixed_l[:] = _yl_arr
+                    _xr = float(mixed_r[-1])
+                    _yr_arr, _ = self._scipy_lfilter(
+                        _DC_B, _hp_den, mixed_r,
+                        zi=[_hp_1ma * self._sub_hp_y_r - self._sub_hp_x_r])
+                    mixed_r[:] = _yr_arr
+                    _yl, _yr = float(_yl_arr[-1]), float(_yr_arr[-1])
+                else:
+                    _xl, _yl = self._sub_hp_x_l, self._sub_hp_y_l
+                    _xr, _yr = self._sub_hp_x_r, self._sub_hp_y_r
+                    for _i in range(frame_count):
+                        _xl_new = mixed_l[_i]
+                        _yl_new = _xl_new - _xl + _hp_1ma * _yl
+                        mixed_l[_i] = _yl_new
+                        _xl, _yl = _xl_new, _yl_new
+                        _xr_new = mixed_r[_i]
+                        _yr_new = _xr_new - _xr + _hp_1ma * _yr
+                        mixed_r[_i] = _yr_new
+                        _xr, _yr = _xr_new, _yr_new
+                self._sub_hp_x_l, self._sub_hp_y_l = _xl, _yl
+                self._sub_hp_x_r, self._sub_hp_y_r = _xr, _yr
+
+                # Tier 3: in-place clip — avoids creating two new 480-element arrays per buffer.
+                # mixed_l/mixed_r already live in pre-allocated _cb_mixed_l/r; clip to ±1 in-place.
+                np.clip(mixed_l, -1.0, 1.0, out=mixed_l)
+                np.clip(mixed_r, -1.0, 1.0, out=mixed_r)
             clipped_l = mixed_l
             clipped_r = mixed_r
 
@@ -3485,8 +4309,9 @@ class SynthEngine:
                 remaining = len(self._metro_click_buf) - self._metro_click_pos
                 n_click = min(frame_count, remaining)
                 chunk = self._metro_click_buf[self._metro_click_pos:self._metro_click_pos + n_click]
-                clipped_l[:n_click] = np.clip(clipped_l[:n_click] + chunk, -1.0, 1.0)
-                clipped_r[:n_click] = np.clip(clipped_r[:n_click] + chunk, -1.0, 1.0)
+                for _ch in (clipped_l[:n_click], clipped_r[:n_click]):
+                    _ch += chunk
+                    np.clip(_ch, -1.0, 1.0, out=_ch)
                 self._metro_click_pos += n_click
                 if self._metro_click_pos >= len(self._metro_click_buf):
                     self._metro_click_buf = None
@@ -3494,19 +4319,30 @@ class SynthEngine:
             # --- Output transformer: one-pole 18 kHz LP + even harmonic ---
             # The LP softens extreme highs (analog output transformer roundness).
             # Even harmonic x += k*x² injects 2nd harmonic warmth with no per-
-            # sample Python loop: scipy lfilter fast path (C/GIL-free) when
-            # available; scalar ARM fallback otherwise. Pre-allocated _xfmr_sq_buf
-            # avoids temporary array creation on the hot path.
+            # sample Python loop: numba kernel in place when available (lfilter
+            # returns a fresh float64 array per channel per buffer), then scipy
+            # lfilter (C/GIL-free), then a scalar ARM fallback.  All three keep
+            # the state in _XFMR_LP_ZI_L/R as lfilter's zi.  Pre-allocated
+            # _xfmr_sq_buf avoids temporary array creation on the hot path.
+            # lfilter already promotes the float32 input to the float64
+            # coefficients' type, and the slice assignment casts back, so no
+            # explicit astype copies are needed.
             _fc = frame_count
-            if self._scipy_lfilter is not None:
+            if _dsp_kernels.NUMBA_AVAILABLE:
+                _xb = float(self._XFMR_LP_B[0])
+                _xc = -float(self._XFMR_LP_A[1])
+                for _ch, _zi in ((clipped_l[:_fc], self._XFMR_LP_ZI_L),
+                                 (clipped_r[:_fc], self._XFMR_LP_ZI_R)):
+                    _zi[0] = _dsp_kernels.one_pole_lowpass_kernel(_ch, _ch, _xb, _xc, _zi[0])
+            elif self._scipy_lfilter is not None:
                 _tl, self._XFMR_LP_ZI_L = self._scipy_lfilter(
                     self._XFMR_LP_B, self._XFMR_LP_A,
-                    clipped_l[:_fc].astype(np.float64), zi=self._XFMR_LP_ZI_L)
-                clipped_l[:_fc] = _tl.astype(np.float32)
+                    clipped_l[:_fc], zi=self._XFMR_LP_ZI_L)
+                clipped_l[:_fc] = _tl
                 _tr, self._XFMR_LP_ZI_R = self._scipy_lfilter(
                     self._XFMR_LP_B, self._XFMR_LP_A,
-                    clipped_r[:_fc].astype(np.float64), zi=self._XFMR_LP_ZI_R)
-                clipped_r[:_fc] = _tr.astype(np.float32)
+                    clipped_r[:_fc], zi=self._XFMR_LP_ZI_R)
+                clipped_r[:_fc] = _tr
             else:
                 # Scalar loop for ARM / no-scipy. 512 iters, no allocation.
                 _xc  = -float(self._XFMR_LP_A[1])
@@ -3523,9 +4359,11 @@ class SynthEngine:
             # Even harmonic: x += k*x² — pre-alloc buf reused for both channels.
             _sq = self._xfmr_sq_buf[:_fc]
             np.multiply(clipped_l[:_fc], clipped_l[:_fc], out=_sq)
-            clipped_l[:_fc] += self._XFMR_EVEN * _sq
+            _sq *= self._XFMR_EVEN
+            clipped_l[:_fc] += _sq
             np.multiply(clipped_r[:_fc], clipped_r[:_fc], out=_sq)
-            clipped_r[:_fc] += self._XFMR_EVEN * _sq
+            _sq *= self._XFMR_EVEN
+            clipped_r[:_fc] += _sq
             np.clip(clipped_l[:_fc], -1.0, 1.0, out=clipped_l[:_fc])
             np.clip(clipped_r[:_fc], -1.0, 1.0, out=clipped_r[:_fc])
 
@@ -3556,9 +4394,11 @@ class SynthEngine:
             if self._comp_gain < 0.98:
                 _k2 = (1.0 - self._comp_gain) * self._COMP_HARMONIC
                 np.multiply(clipped_l[:_fc], clipped_l[:_fc], out=_sq)
-                clipped_l[:_fc] += _k2 * _sq
+                _sq *= _k2
+                clipped_l[:_fc] += _sq
                 np.multiply(clipped_r[:_fc], clipped_r[:_fc], out=_sq)
-                clipped_r[:_fc] += _k2 * _sq
+                _sq *= _k2
+                clipped_r[:_fc] += _sq
                 np.clip(clipped_l[:_fc], -1.0, 1.0, out=clipped_l[:_fc])
                 np.clip(clipped_r[:_fc], -1.0, 1.0, out=clipped_r[:_fc])
 
@@ -3566,15 +4406,17 @@ class SynthEngine:
             self._last_output_R = float(clipped_r[-1])
 
             # Cache VU meter levels for visualizer (thread-safe float write).
-            # Max amplitude of this buffer for left/right channels.
-            self.level_l = float(np.max(np.abs(clipped_l)))
-            self.level_r = float(np.max(np.abs(clipped_r)))
+            # Max amplitude of this buffer for left/right channels, taken from
+            # max/min so no np.abs temporary is allocated.
+            self.level_l = max(float(clipped_l.max()), -float(clipped_l.min()))
+            self.level_r = max(float(clipped_r.max()), -float(clipped_r.min()))
             if self._level_shm is not None:
                 struct.pack_into('ff', self._level_shm.buf, 0, self.level_l, self.level_r)
                 # Write mono-mix samples into the circular waveform buffer.
                 # Layout: bytes 8-11 = write_pos (i32), bytes 12+ = 2048 x f32 samples.
                 _WF_N = 2048
-                mono = ((clipped_l + clipped_r) * 0.5).astype(np.float32)
+                mono = np.add(clipped_l, clipped_r, out=self._xfmr_sq_buf[:frame_count])
+                mono *= 0.5
                 n = len(mono)
                 wp = struct.unpack_from('i', self._level_shm.buf, 8)[0]
                 wf_arr = np.ndarray((_WF_N,), dtype=np.float32,
@@ -3610,15 +4452,26 @@ class SynthEngine:
             # second half r2.  noise = (r1 - r2) * AMP has triangular
             # distribution on (-AMP, +AMP) = one 16-bit LSB width.
             # Two generator calls instead of four — see __init__ comment.
+            # The dither is formed in the first half of each random buffer and
+            # the signal is added there.  The final clip then reads both
+            # channels through a transposed view and writes PortAudio's
+            # interleaved (frames, 2) buffer front to back in one pass, instead
+            # of one strided column store per channel.  With numba the clip and
+            # the interleaved store are a single loop.
             fc = frame_count
-            buf_l = self._dither_buf_l[:2 * fc]
-            buf_r = self._dither_buf_r[:2 * fc]
-            self._dither_rng_l.random(2 * fc, dtype=np.float32, out=buf_l)
-            self._dither_rng_r.random(2 * fc, dtype=np.float32, out=buf_r)
-            dither_l = (buf_l[:fc] - buf_l[fc:]) * self._DITHER_AMP
-            dither_r = (buf_r[:fc] - buf_r[fc:]) * self._DITHER_AMP
-            outdata[:fc, 0] = np.clip(clipped_l + dither_l, -1.0, 1.0)
-            outdata[:fc, 1] = np.clip(clipped_r + dither_r, -1.0, 1.0)
+            for _buf, _rng, _src in ((self._dither_buf_l, self._dither_rng_l, clipped_l),
+                                     (self._dither_buf_r, self._dither_rng_r, clipped_r)):
+                _rng.random(2 * fc, dtype=np.float32, out=_buf[:2 * fc])
+                _d = _buf[:fc]
+                np.subtract(_d, _buf[fc:2 * fc], out=_d)
+                _d *= self._DITHER_AMP
+                _d += _src
+            _out = outdata[:fc]
+            if _dsp_kernels.NUMBA_AVAILABLE:
+                _dsp_kernels.interleave_clip_kernel(self._dither_buf[:, :fc], _out)
+            else:
+                np.maximum(self._dither_buf[:, :fc].T, np.float32(-1.0), out=_out)
+                np.minimum(_out, np.float32(1.0), out=_out)
 
             if _arm_probe:
                 _cb_ms = (self._perf_counter() - _cb_t0) * 1000.0
@@ -3636,15 +4489,16 @@ class SynthEngine:
         if note in self._held_notes_ordered:
             self._held_notes_ordered.remove(note)
         self._held_notes_ordered.append(note)
-        self._held_notes_vel[note] = velocity / 127.0
-        self.midi_event_queue.put({'type': 'note_on', 'note': note, 'velocity': velocity / 127.0})
+        vel = _vel_norm(velocity)
+        self._held_notes_vel[note] = vel
+        self.midi_event_queue.put({'type': 'note_on', 'note': note, 'velocity': vel})
 
     def note_off(self, note: int, velocity: int = 0):
         self.held_notes.discard(note)
         if note in self._held_notes_ordered:
             self._held_notes_ordered.remove(note)
         self._held_notes_vel.pop(note, None)
-        self.midi_event_queue.put({'type': 'note_off', 'note': note, 'velocity': velocity / 127.0})
+        self.midi_event_queue.put({'type': 'note_off', 'note': note, 'velocity': _vel_norm(velocity)})
 
     def all_notes_off(self):
         """Silence all voices. Called from the UI thread (mode switch, panic).
@@ -3774,6 +4628,9 @@ class SynthEngine:
     def is_available(self) -> bool: return AUDIO_AVAILABLE and self.running
 
     def warm_up(self):
+        # Compile the numba filter kernels now rather than on the first note,
+        # where JIT compilation would stall the audio callback.
+        _dsp_kernels.warm_up()
         if not self.is_available():
             return
         if self._IS_ARM:
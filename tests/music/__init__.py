@@ -0,0 +1,2 @@
+# ABOUTME: Tests for the synth engine support modules (music package).
+# ABOUTME: Pure DSP tests; no audio device or display needed.
@@ -0,0 +1,110 @@
+# ABOUTME: Unit tests for the per-sample DSP kernels in music/_dsp_kernels.py.
+# ABOUTME: Checks compiled kernels against their pure-Python form and basic filter behavior.
+
+import numpy as np
+import pytest
+
+from music import _dsp_kernels as k
+
+
+def _py(fn):
+    """Pure-Python body of a kernel (numba keeps it on .py_func)."""
+    return getattr(fn, "py_func", fn)
+
+
+def _noise(n=480, seed=1):
+    return np.random.default_rng(seed).uniform(-1.0, 1.0, n).astype(np.float32)
+
+
+@pytest.mark.parametrize("mode", [k.SVF_OUT_HP, k.SVF_OUT_BP, k.SVF_OUT_NOTCH, k.SVF_OUT_LP])
+def test_svf_kernel_matches_python(mode):
+    x = _noise()
+    out_jit = np.zeros_like(x)
+    out_py = np.zeros_like(x)
+    st_jit = k.svf_hp_kernel(x, out_jit, 0.2, 1.5, 0.1, -0.1, mode)
+    st_py = _py(k.svf_hp_kernel)(x, out_py, 0.2, 1.5, 0.1, -0.1, mode)
+    np.testing.assert_allclose(out_jit, out_py, atol=1e-6)
+    assert st_jit == pytest.approx(st_py)
+
+
+def test_svf_hp_rejects_dc():
+    x = np.ones(4800, dtype=np.float32)
+    out = np.zeros_like(x)
+    k.svf_hp_kernel(x, out, 0.05, 1.0, 0.0, 0.0, k.SVF_OUT_HP)
+    assert abs(out[-1]) < 1e-3
+
+
+def test_ladder_kernel_matches_python():
+    x = _noise()
+    out_jit = np.zeros_like(x)
+    out_py = np.zeros_like(x)
+    st_jit = k.ladder_kernel(x, out_jit, 0.3, 0.9, 0.0, 0.1, 0.2, 0.3)
+    st_py = _py(k.ladder_kernel)(x, out_py, 0.3, 0.9, 0.0, 0.1, 0.2, 0.3)
+    np.testing.assert_allclose(out_jit, out_py, atol=1e-6)
+    assert st_jit == pytest.approx(st_py)
+    assert np.max(np.abs(out_jit)) <= 1.0
+
+
+def test_leaky_integrator_matches_python():
+    x = _noise()
+    out_jit = np.zeros_like(x)
+    out_py = np.zeros_like(x)
+    st_jit = k.leaky_integrator_kernel(x, out_jit, 0.05, 0.2)
+    st_py = _py(k.leaky_integrator_kernel)(x, out_py, 0.05, 0.2)
+    np.testing.assert_allclose(out_jit, out_py, atol=1e-6)
+    assert st_jit == pytest.approx(st_py)
+    assert st_jit == pytest.approx(float(out_jit[-1]), abs=1e-6)
+
+
+def test_stereo_highpass_clip_matches_python():
+    left = _noise(seed=2) * 1.5
+    right = _noise(seed=3) * 1.5
+    l_jit, r_jit = left.copy(), right.copy()
+    l_py, r_py = left.copy(), right.copy()
+    st_jit = k.stereo_highpass_clip_kernel(l_jit, r_jit, 0.997, 0.1, 0.05, -0.1, 0.0)
+    st_py = _py(k.stereo_highpass_clip_kernel)(l_py, r_py, 0.997, 0.1, 0.05, -0.1, 0.0)
+    np.testing.assert_allclose(l_jit, l_py, atol=1e-6)
+    np.testing.assert_allclose(r_jit, r_py, atol=1e-6)
+    assert st_jit == pytest.approx(st_py)
+    assert np.abs(l_jit).max() <= 1.0
+
+
+def test_interleave_clip_matches_numpy():
+    src = np.stack([_noise(seed=4), _noise(seed=5)]) * 1.5
+    out = np.zeros((src.shape[1], 2), dtype=np.float32)
+    k.interleave_clip_kernel(src, out)
+    np.testing.assert_array_equal(out, np.clip(src.T, -1.0, 1.0))
+
+
+def test_dc_blocker_matches_lfilter():
+    signal = pytest.importorskip("scipy.signal")
+    x = _noise(seed=6) + 0.3
+    out = np.zeros_like(x)
+    z, x_last, y_last = k.dc_blocker_kernel(x, out, 0.999, 0.02)
+    ref, zf = signal.lfilter([1.0, -1.0], [1.0, -0.999], x, zi=[0.02])
+    np.testing.assert_array_equal(out, ref.astype(np.float32))
+    assert z == zf[0]
+    assert (x_last, y_last) == (float(x[-1]), ref[-1])
+
+
+def test_one_pole_lowpass_matches_lfilter():
+    signal = pytest.importorskip("scipy.signal")
+    x = _noise(seed=10)
+    out = x.copy()
+    z = k.one_pole_lowpass_kernel(out, out, 0.1, 0.9, 0.05)
+    ref, zf = signal.lfilter([0.1], [1.0, -0.9], x, zi=[0.05])
+    np.testing.assert_array_equal(out, ref.astype(np.float32))
+    assert z == zf[0]
+
+
+def test_dc_blocker_rows_filters_selected_rows_in_place():
+    mat = np.stack([_noise(seed=s) for s in (7, 8, 9)])
+    ref = mat.copy()
+    state = np.zeros((2, 3))
+    k.dc_blocker_rows_kernel(mat, np.array([2, 0]), np.array([0.999, 0.9997]), state, 480)
+    np.testing.assert_array_equal(mat[1], ref[1])
+    for r, (row, c) in enumerate(((2, 0.999), (0, 0.9997))):
+        out = np.zeros(480, dtype=np.float32)
+        z, _, _ = k.dc_blocker_kernel(ref[row], out, c, 0.0)
+        np.testing.assert_array_equal(mat[row], out)
+        assert state[r, 0] == z
@@ -0,0 +1,63 @@
+# ABOUTME: Unit tests for music/event_queue.py, the audio thread's MIDI event FIFO.
+# ABOUTME: Covers FIFO order, batch draining, requeueing, queue.Queue-compatible put side and threaded producers.
+
+import queue
+import threading
+
+import pytest
+
+from music.event_queue import EventQueue
+
+
+def test_drain_returns_events_in_order_and_empties():
+    q = EventQueue()
+    for i in range(5):
+        q.put({"type": "note_on", "note": 60 + i})
+    events = q.drain()
+    assert [e["note"] for e in events] == [60, 61, 62, 63, 64]
+    assert q.empty()
+    assert q.drain() == []
+
+
+def test_requeue_puts_deferred_events_ahead_of_new_ones():
+    q = EventQueue()
+    for i in range(5):
+        q.put(i)
+    events = q.drain()
+    q.put(5)
+    q.requeue(events[2:])
+    assert q.drain() == [2, 3, 4, 5]
+
+
+def test_queue_compatible_put_and_get():
+    q = EventQueue()
+    q.put({"type": "mute_gate"}, block=True, timeout=1.0)
+    q.put_nowait({"type": "all_notes_off"})
+    assert q.qsize() == 2
+    assert q.get_nowait()["type"] == "mute_gate"
+    assert q.get_nowait()["type"] == "all_notes_off"
+    with pytest.raises(queue.Empty):
+        q.get_nowait()
+
+
+def test_concurrent_producers_lose_nothing():
+    q = EventQueue()
+    per_thread = 2000
+
+    def produce(tid):
+        for i in range(per_thread):
+            q.put((tid, i))
+
+    threads = [threading.Thread(target=produce, args=(t,)) for t in range(4)]
+    for t in threads:
+        t.start()
+    got = []
+    while any(t.is_alive() for t in threads):
+        got.extend(q.drain())
+    for t in threads:
+        t.join()
+    got.extend(q.drain())
+
+    assert len(got) == 4 * per_thread
+    for tid in range(4):
+        assert [i for t, i in got if t == tid] == list(range(per_thread))